@@ -1,29 +1,30 @@
 # coding=utf-8
 
+import atexit
 import json
 import os
 import random
 import re
+import sys
+import threading
 import time
 import webbrowser
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.header import Header
-from email.utils import formataddr, formatdate, make_msgid
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Callable, Dict, List, Tuple, Optional, Union
 
 import pytz
 import requests
 import yaml
 
 try:
-    import resend
-    RESEND_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    RESEND_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 
 VERSION = "3.4.1"
@@ -61,6 +62,21 @@ SMTP_CONFIGS = {
 }
 
 
+# === HTTP ===
+# One session per thread, so batches sent to the same webhook host reuse the
+# keep-alive connection instead of a new TCP/TLS handshake. The notification
+# senders run side by side and requests.Session is not documented as thread-safe
+_HTTP_SESSIONS = threading.local()
+
+
+def _http_session() -> requests.Session:
+    """Get the calling thread's HTTP session"""
+    session = getattr(_HTTP_SESSIONS, "session", None)
+    if session is None:
+        session = _HTTP_SESSIONS.session = requests.Session()
+    return session
+
+
 # === Configuration Management ===
 def load_config():
     """Load configuration file"""
@@ -108,6 +124,8 @@ def load_config():
         "BARK_BATCH_SIZE": config_data["notification"].get("bark_batch_size", 3600),
         "SLACK_BATCH_SIZE": config_data["notification"].get("slack_batch_size", 4000),
         "BATCH_SEND_INTERVAL": config_data["notification"]["batch_send_interval"],
+        "HTTP_TIMEOUT_FAST": config_data["notification"].get("http_timeout_fast", 5),
+        "HTTP_TIMEOUT_SLOW": config_data["notification"].get("http_timeout_slow", 10),
         "FEISHU_MESSAGE_SEPARATOR": config_data["notification"][
             "feishu_message_separator"
         ],
@@ -292,8 +310,12 @@ def format_time_filename():
     return get_beijing_time().strftime("%H-%M")
 
 
+@lru_cache(maxsize=4096)
 def clean_title(title: str) -> str:
-    """Clean special characters from title"""
+    """Clean special characters from title
+
+    Cached: every notification channel formats the same titles again.
+    """
     if not isinstance(title, str):
         title = str(title)
     cleaned_title = title.replace("\n", " ").replace("\r", " ")
@@ -315,6 +337,12 @@ def get_output_path(subfolder: str, filename: str) -> str:
     return str(output_dir / filename)
 
 
+def file_uri(path: str) -> str:
+    """Build a file:// URL for a local path without resolving symlinks"""
+    path = os.fspath(path)
+    return "file://" + (path if os.path.isabs(path) else os.path.abspath(path))
+
+
 def check_version_update(
     current_version: str, version_url: str, proxy_url: Optional[str] = None
 ) -> Tuple[bool, Optional[str]]:
@@ -1187,6 +1215,65 @@ def matches_word_groups(
     return False
 
 
+# Matched word group index per title, one dict per (word groups, filter
+# words) config. The same titles are matched again by every crawl's
+# realtime and summary passes
+_WORD_GROUP_MATCH_CACHE: Dict[Tuple, Dict[str, Optional[int]]] = {}
+
+
+def _get_word_group_match_cache(
+    word_groups: List[Dict], filter_words: List[str]
+) -> Dict[str, Optional[int]]:
+    """Get the title -> word group index cache for a word group config"""
+    key = (
+        tuple(
+            (group["group_key"], tuple(group["required"]), tuple(group["normal"]))
+            for group in word_groups
+        ),
+        tuple(filter_words),
+    )
+    cache = _WORD_GROUP_MATCH_CACHE.get(key)
+    if cache is None:
+        cache = _WORD_GROUP_MATCH_CACHE[key] = {}
+    return cache
+
+
+def find_matching_word_group(
+    title: str, word_groups: List[Dict], filter_words: List[str]
+) -> Optional[int]:
+    """Get index of the first word group the title matches, None if filtered out or unmatched"""
+    if not matches_word_groups(title, word_groups, filter_words):
+        return None
+
+    # If "All News" mode, all titles match the first (only) word group
+    if len(word_groups) == 1 and word_groups[0]["group_key"] == "All News":
+        return 0
+
+    # Defensive conversion ensures type safety
+    title_lower = str(title).lower() if not isinstance(title, str) else title.lower()
+    for index, group in enumerate(word_groups):
+        required_words = group["required"]
+        normal_words = group["normal"]
+
+        if required_words:
+            all_required_present = all(
+                req_word.lower() in title_lower for req_word in required_words
+            )
+            if not all_required_present:
+                continue
+
+        if normal_words:
+            any_normal_present = any(
+                normal_word.lower() in title_lower for normal_word in normal_words
+            )
+            if not any_normal_present:
+                continue
+
+        return index
+
+    return None
+
+
 def format_time_display(first_time: str, last_time: str) -> str:
     """Format time display"""
     if not first_time:
@@ -1329,6 +1416,8 @@ def count_word_frequency(
         group_key = group["group_key"]
         word_stats[group_key] = {"count": 0, "titles": {}}
 
+    match_cache = _get_word_group_match_cache(word_groups, filter_words)
+
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
 
@@ -1339,12 +1428,15 @@ def count_word_frequency(
             if title in processed_titles.get(source_id, {}):
                 continue
 
-            # Use unified matching logic
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words
-            )
+            # Use unified matching logic, cached per title for this word group config
+            if title in match_cache:
+                group_index = match_cache[title]
+            else:
+                group_index = match_cache[title] = find_matching_word_group(
+                    title, word_groups, filter_words
+                )
 
-            if not matches_frequency_words:
+            if group_index is None:
                 continue
 
             # If incremental mode or first crawl in current mode, count matching new news
@@ -1357,115 +1449,83 @@ def count_word_frequency(
             source_url = title_data.get("url", "")
             source_mobile_url = title_data.get("mobileUrl", "")
 
-            # Find matching word group (defensive conversion ensures type safety)
-            title_lower = str(title).lower() if not isinstance(title, str) else title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # If "All News" mode, all titles match the first (only) word group
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "All News":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # Original matching logic
-                    if required_words:
-                        all_required_present = all(
-                            req_word.lower() in title_lower
-                            for req_word in required_words
-                        )
-                        if not all_required_present:
-                            continue
+            group_key = word_groups[group_index]["group_key"]
+            word_stats[group_key]["count"] += 1
+            if source_id not in word_stats[group_key]["titles"]:
+                word_stats[group_key]["titles"][source_id] = []
 
-                    if normal_words:
-                        any_normal_present = any(
-                            normal_word.lower() in title_lower
-                            for normal_word in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # For current mode, get complete data from historical stats
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time)
-
-                source_name = id_to_name.get(source_id, source_id)
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = source_ranks if source_ranks else []
+            url = source_url
+            mobile_url = source_mobile_url
 
-                # Determine if news is new
-                is_new = False
-                if all_news_are_new:
-                    # In incremental mode all processed news is new, or all news on first crawl is new
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # Check if in new titles list
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
-                )
-
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            # For current mode, get complete data from historical stats
+            if (
+                mode == "current"
+                and title_info
+                and source_id in title_info
+                and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+            elif (
+                title_info
+                and source_id in title_info
+                and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+
+            if not ranks:
+                ranks = [99]
+
+            time_display = format_time_display(first_time, last_time)
+
+            source_name = id_to_name.get(source_id, source_id)
+
+            # Determine if news is new
+            is_new = False
+            if all_news_are_new:
+                # In incremental mode all processed news is new, or all news on first crawl is new
+                is_new = True
+            elif new_titles and source_id in new_titles:
+                # Check if in new titles list
+                new_titles_for_source = new_titles[source_id]
+                is_new = title in new_titles_for_source
+
+            word_stats[group_key]["titles"][source_id].append(
+                {
+                    "title": title,
+                    "source_name": source_name,
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "time_display": time_display,
+                    "count": count_info,
+                    "ranks": ranks,
+                    "rank_threshold": rank_threshold,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                    "is_new": is_new,
+                }
+            )
 
-                break
+            if source_id not in processed_titles:
+                processed_titles[source_id] = {}
+            processed_titles[source_id][title] = True
 
     # Print summary info at the end
     if mode == "incremental":
@@ -1674,9 +1734,12 @@ def prepare_report_data(
 
 
 def format_title_for_platform(
-    platform: str, title_data: Dict, show_source: bool = True
+    platform: str, title_data: Dict, show_source: bool = True, show_new: bool = True
 ) -> str:
-    """Unified title formatting method for different platforms"""
+    """Unified title formatting method for different platforms
+
+    show_new=False suppresses the 🆕 marker without copying title_data.
+    """
     rank_display = format_rank_display(
         title_data["ranks"], title_data["rank_threshold"], platform
     )
@@ -1691,7 +1754,7 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if show_new and title_data.get("is_new") else ""
 
         if show_source:
             result = f"<font color='grey'>[{title_data['source_name']}]</font> {title_prefix}{formatted_title}"
@@ -1713,7 +1776,7 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if show_new and title_data.get("is_new") else ""
 
         if show_source:
             result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
@@ -1736,7 +1799,7 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if show_new and title_data.get("is_new") else ""
 
         if show_source:
             result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
@@ -1758,7 +1821,7 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if show_new and title_data.get("is_new") else ""
 
         if show_source:
             result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
@@ -1780,7 +1843,7 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if show_new and title_data.get("is_new") else ""
 
         if show_source:
             result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
@@ -1804,7 +1867,7 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if show_new and title_data.get("is_new") else ""
 
         if show_source:
             result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
@@ -1850,7 +1913,7 @@ def format_title_for_platform(
         if title_data["count"] > 1:
             formatted_title += f" <font color='green'>({title_data['count']}times)</font>"
 
-        if title_data.get("is_new"):
+        if show_new and title_data.get("is_new"):
             formatted_title = f"<div class='new-title'>🆕 {formatted_title}</div>"
 
         return formatted_title
@@ -2967,10 +3030,8 @@ def render_feishu_content(
             )
 
             for j, title_data in enumerate(source_data["titles"], 1):
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
                 formatted_title = format_title_for_platform(
-                    "feishu", title_data_copy, show_source=False
+                    "feishu", title_data, show_source=False, show_new=False
                 )
                 text_content += f"  {j}. {formatted_title}\n"
 
@@ -3063,10 +3124,8 @@ def render_dingtalk_content(
             text_content += f"**{source_data['source_name']}** ({len(source_data['titles'])} items):\n\n"
 
             for j, title_data in enumerate(source_data["titles"], 1):
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
                 formatted_title = format_title_for_platform(
-                    "dingtalk", title_data_copy, show_source=False
+                    "dingtalk", title_data, show_source=False, show_new=False
                 )
                 text_content += f"  {j}. {formatted_title}\n"
 
@@ -3088,6 +3147,43 @@ def render_dingtalk_content(
     return text_content
 
 
+# Numbered list prefixes ("  1. ", "  2. ", ...) for batch news lines
+_ITEM_PREFIXES = tuple(f"  {i}. " for i in range(1025))
+
+
+def _item_prefix(index: int) -> str:
+    """Get the numbered list prefix for a news line"""
+    if index < len(_ITEM_PREFIXES):
+        return _ITEM_PREFIXES[index]
+    return f"  {index}. "
+
+
+# Piece markers for _pack_batches: separators are dropped when they don't fit,
+# trailing newlines are always appended
+_PIECE_OPTIONAL = object()
+_PIECE_ALWAYS = object()
+
+
+def _utf8_len(text: str) -> int:
+    """Return the UTF-8 encoded byte length of text"""
+    # str.isascii() reads a flag CPython already keeps on the string, and an
+    # ASCII string's byte length equals its character count
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-8"))
+
+
+def _utf8_lens(texts: List[str]) -> List[int]:
+    """Return the UTF-8 byte lengths of many strings with a single encode call"""
+    joined = "\x00".join(texts)
+    if joined.isascii():
+        return [len(text) for text in texts]
+    if joined.count("\x00") != len(texts) - 1:
+        # Some text contains NUL itself, can't split on it
+        return [_utf8_len(text) for text in texts]
+    return [len(chunk) for chunk in joined.encode("utf-8").split(b"\x00")]
+
+
 def _get_batch_header(format_type: str, batch_num: int, total_batches: int) -> str:
     """Generate batch header based on format_type"""
     if format_type == "telegram":
@@ -3102,6 +3198,7 @@ def _get_batch_header(format_type: str, batch_num: int, total_batches: int) -> s
         return f"**[Part {batch_num}/{total_batches}]**\n\n"
 
 
+@lru_cache(maxsize=16)
 def _get_max_batch_header_size(format_type: str) -> int:
     """Estimate max batch header size in bytes (assuming max 99 batches)
 
@@ -3154,11 +3251,11 @@ def add_batch_headers(
     for i, content in enumerate(batches, 1):
         # Generate batch header
         header = _get_batch_header(format_type, i, total)
-        header_size = len(header.encode("utf-8"))
+        header_size = _utf8_len(header)
 
         # Dynamically calculate max allowed content size
         max_content_size = max_bytes - header_size
-        content_size = len(content.encode("utf-8"))
+        content_size = _utf8_len(content)
 
         # If exceeded, truncate to safe size
         if content_size > max_content_size:
@@ -3192,9 +3289,11 @@ def split_content_into_batches(
 
     batches = []
 
-    total_titles = sum(
-        len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
-    )
+    stats = report_data["stats"]
+    new_titles = report_data["new_titles"]
+    failed_ids = report_data["failed_ids"]
+
+    total_titles = sum(len(stat["titles"]) for stat in stats if stat["count"] > 0)
     now = get_beijing_time()
 
     base_header = ""
@@ -3241,7 +3340,7 @@ def split_content_into_batches(
             base_footer += f"\n_TrendRadar New version available *{update_info['remote_version']}*, current *{update_info['current_version']}_"
 
     stats_header = ""
-    if report_data["stats"]:
+    if stats:
         if format_type in ("wework", "bark"):
             stats_header = f"📊 **Hot Keywords Statistics**\n\n"
         elif format_type == "telegram":
@@ -3255,13 +3354,10 @@ def split_content_into_batches(
         elif format_type == "slack":
             stats_header = f"📊 *Hot Keywords Statistics*\n\n"
 
-    current_batch = base_header
-    current_batch_has_content = False
-
     if (
-        not report_data["stats"]
-        and not report_data["new_titles"]
-        and not report_data["failed_ids"]
+        not stats
+        and not new_titles
+        and not failed_ids
     ):
         if mode == "incremental":
             mode_text = "No new matching hot keywords in incremental mode"
@@ -3274,28 +3370,27 @@ def split_content_into_batches(
         batches.append(final_content)
         return batches
 
+    # Render the report into pieces first, then pack them into batches.
+    # Each piece is (text, restart_prefix): when text doesn't fit into the
+    # current batch, a new batch is started with restart_prefix + text.
+    # Prefixes are joined once per section/keyword/source and shared by
+    # all of its pieces
+    pieces = []
+
     # Process Hot Keywords Statistics
-    if report_data["stats"]:
-        total_count = len(report_data["stats"])
+    if stats:
+        total_count = len(stats)
 
         # Add statistics header
-        test_content = current_batch + stats_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
-            current_batch_has_content = True
-        else:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + stats_header
-            current_batch_has_content = True
+        pieces.append((stats_header, base_header))
+        stats_prefix = base_header + stats_header
 
         # Process keywords one by one (ensure keyword title + first news stay atomic)
-        for i, stat in enumerate(report_data["stats"]):
+        for i, stat in enumerate(stats):
             word = stat["word"]
             count = stat["count"]
+            titles = stat["titles"]
+            title_count = len(titles)
             sequence_display = f"[{i + 1}/{total_count}]"
 
             # Build keyword title
@@ -3361,8 +3456,8 @@ def split_content_into_batches(
 
             # Build first news item
             first_news_line = ""
-            if stat["titles"]:
-                first_title_data = stat["titles"][0]
+            if titles:
+                first_title_data = titles[0]
                 if format_type in ("wework", "bark"):
                     formatted_title = format_title_for_platform(
                         "wework", first_title_data, show_source=True
@@ -3390,32 +3485,19 @@ def split_content_into_batches(
                 else:
                     formatted_title = f"{first_title_data['title']}"
 
-                first_news_line = f"  1. {formatted_title}\n"
-                if len(stat["titles"]) > 1:
+                first_news_line = _ITEM_PREFIXES[1] + formatted_title + "\n"
+                if title_count > 1:
                     first_news_line += "\n"
 
             # Atomicity check: keyword title + first news must be processed together
             word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                # Current batch can't fit, start new batch
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + stats_header + word_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            pieces.append((word_with_first_news, stats_prefix))
+            word_prefix = stats_prefix + word_header
+            start_index = 1
 
             # Process remaining news items
-            for j in range(start_index, len(stat["titles"])):
-                title_data = stat["titles"][j]
+            for j in range(start_index, title_count):
+                title_data = titles[j]
                 if format_type in ("wework", "bark"):
                     formatted_title = format_title_for_platform(
                         "wework", title_data, show_source=True
@@ -3443,25 +3525,14 @@ def split_content_into_batches(
                 else:
                     formatted_title = f"{title_data['title']}"
 
-                news_line = f"  {j + 1}. {formatted_title}\n"
-                if j < len(stat["titles"]) - 1:
+                news_line = _item_prefix(j + 1) + formatted_title + "\n"
+                if j < title_count - 1:
                     news_line += "\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + stats_header + word_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+                pieces.append((news_line, word_prefix))
 
             # Separator between keywords
-            if i < len(report_data["stats"]) - 1:
+            if i < total_count - 1:
                 separator = ""
                 if format_type in ("wework", "bark"):
                     separator = f"\n\n\n\n"
@@ -3476,15 +3547,10 @@ def split_content_into_batches(
                 elif format_type == "slack":
                     separator = f"\n\n"
 
-                test_content = current_batch + separator
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    < max_bytes
-                ):
-                    current_batch = test_content
+                pieces.append((separator, _PIECE_OPTIONAL))
 
     # Process new news (also ensure source title + first news stay atomic)
-    if report_data["new_titles"]:
+    if new_titles:
         new_header = ""
         if format_type in ("wework", "bark"):
             new_header = f"\n\n\n\n🆕 **New Hot News** ({report_data['total_new_count']} total)\n\n"
@@ -3501,132 +3567,98 @@ def split_content_into_batches(
         elif format_type == "slack":
             new_header = f"\n\n🆕 *New Hot News* ({report_data['total_new_count']} total)\n\n"
 
-        test_content = current_batch + new_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        pieces.append((new_header, base_header))
+        new_prefix = base_header + new_header
 
         # Process new news sources one by one
-        for source_data in report_data["new_titles"]:
+        for source_data in new_titles:
+            source_name = source_data["source_name"]
+            source_titles = source_data["titles"]
+            source_title_count = len(source_titles)
             source_header = ""
             if format_type in ("wework", "bark"):
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} items):\n\n"
+                source_header = f"**{source_name}** ({source_title_count} items):\n\n"
             elif format_type == "telegram":
-                source_header = f"{source_data['source_name']} ({len(source_data['titles'])} items):\n\n"
+                source_header = f"{source_name} ({source_title_count} items):\n\n"
             elif format_type == "ntfy":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} items):\n\n"
+                source_header = f"**{source_name}** ({source_title_count} items):\n\n"
             elif format_type == "feishu":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} items):\n\n"
+                source_header = f"**{source_name}** ({source_title_count} items):\n\n"
             elif format_type == "dingtalk":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} items):\n\n"
+                source_header = f"**{source_name}** ({source_title_count} items):\n\n"
             elif format_type == "slack":
-                source_header = f"*{source_data['source_name']}* ({len(source_data['titles'])} items):\n\n"
+                source_header = f"*{source_name}* ({source_title_count} items):\n\n"
 
             # Build first new news item
             first_news_line = ""
-            if source_data["titles"]:
-                first_title_data = source_data["titles"][0]
-                title_data_copy = first_title_data.copy()
-                title_data_copy["is_new"] = False
+            if source_titles:
+                first_title_data = source_titles[0]
 
                 if format_type in ("wework", "bark"):
                     formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
+                        "wework", first_title_data, show_source=False, show_new=False
                     )
                 elif format_type == "telegram":
                     formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
+                        "telegram", first_title_data, show_source=False, show_new=False
                     )
                 elif format_type == "feishu":
                     formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
+                        "feishu", first_title_data, show_source=False, show_new=False
                     )
                 elif format_type == "dingtalk":
                     formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
+                        "dingtalk", first_title_data, show_source=False, show_new=False
                     )
                 elif format_type == "slack":
                     formatted_title = format_title_for_platform(
-                        "slack", title_data_copy, show_source=False
+                        "slack", first_title_data, show_source=False, show_new=False
                     )
                 else:
-                    formatted_title = f"{title_data_copy['title']}"
+                    formatted_title = f"{first_title_data['title']}"
 
-                first_news_line = f"  1. {formatted_title}\n"
+                first_news_line = _ITEM_PREFIXES[1] + formatted_title + "\n"
 
             # Atomicity check: source title + first news
             source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            pieces.append((source_with_first_news, new_prefix))
+            source_prefix = new_prefix + source_header
+            start_index = 1
 
             # Process remaining new news
-            for j in range(start_index, len(source_data["titles"])):
-                title_data = source_data["titles"][j]
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
+            for j in range(start_index, source_title_count):
+                title_data = source_titles[j]
 
                 if format_type == "wework":
                     formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
+                        "wework", title_data, show_source=False, show_new=False
                     )
                 elif format_type == "telegram":
                     formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
+                        "telegram", title_data, show_source=False, show_new=False
                     )
                 elif format_type == "feishu":
                     formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
+                        "feishu", title_data, show_source=False, show_new=False
                     )
                 elif format_type == "dingtalk":
                     formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
+                        "dingtalk", title_data, show_source=False, show_new=False
                     )
                 elif format_type == "slack":
                     formatted_title = format_title_for_platform(
-                        "slack", title_data_copy, show_source=False
+                        "slack", title_data, show_source=False, show_new=False
                     )
                 else:
-                    formatted_title = f"{title_data_copy['title']}"
-
-                news_line = f"  {j + 1}. {formatted_title}\n"
-
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + new_header + source_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+                    formatted_title = f"{title_data['title']}"
 
-            current_batch += "\n"
+                news_line = _item_prefix(j + 1) + formatted_title + "\n"
 
-    if report_data["failed_ids"]:
+                pieces.append((news_line, source_prefix))
+
+            pieces.append(("\n", _PIECE_ALWAYS))
+
+    if failed_ids:
         failed_header = ""
         if format_type == "wework":
             failed_header = f"\n\n\n\n⚠️ **Failed Platforms:**\n\n"
@@ -3639,20 +3671,10 @@ def split_content_into_batches(
         elif format_type == "dingtalk":
             failed_header = f"\n---\n\n⚠️ **Failed Platforms:**\n\n"
 
-        test_content = current_batch + failed_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + failed_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        pieces.append((failed_header, base_header))
+        failed_prefix = base_header + failed_header
 
-        for i, id_value in enumerate(report_data["failed_ids"], 1):
+        for i, id_value in enumerate(failed_ids, 1):
             if format_type == "feishu":
                 failed_line = f"  • <font color='red'>{id_value}</font>\n"
             elif format_type == "dingtalk":
@@ -3660,26 +3682,171 @@ def split_content_into_batches(
             else:
                 failed_line = f"  • {id_value}\n"
 
-            test_content = current_batch + failed_line
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + failed_header + failed_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+            pieces.append((failed_line, failed_prefix))
+
+    # Measure every piece once, both the fast path and the packing use it
+    texts = [text for text, _ in pieces]
+    piece_bytes = _utf8_lens(texts)
+
+    # Fast path: the whole report fits into one batch, skip per-piece fit checks
+    footer_bytes = _utf8_len(base_footer)
+    if _utf8_len(base_header) + sum(piece_bytes) + footer_bytes < max_bytes:
+        batches.append(base_header + "".join(texts) + base_footer)
+        return batches
+
+    return _pack_batches(pieces, piece_bytes, base_header, base_footer, max_bytes)
+
+
+def _pack_batches(
+    pieces: List[Tuple[str, Union[str, object]]],
+    piece_bytes: List[int],
+    base_header: str,
+    base_footer: str,
+    max_bytes: int,
+) -> List[str]:
+    """Pack rendered pieces into batches under max_bytes (UTF-8)
+
+    piece_bytes holds the precomputed UTF-8 size of each piece. The current
+    batch is kept as a list of parts plus a running byte count, so splitting
+    is linear and nothing is re-encoded on fit checks.
+    """
+    batches = []
+    footer_bytes = _utf8_len(base_footer)
+    base_header_bytes = _utf8_len(base_header)
+
+    current_parts = [base_header]
+    current_bytes = base_header_bytes
+    current_batch_has_content = False
+
+    # Restart prefixes are shared between pieces, measure each only once
+    prefix_bytes = {}
+
+    for (text, restart_prefix), text_bytes in zip(pieces, piece_bytes):
+        if restart_prefix is _PIECE_ALWAYS:
+            current_parts.append(text)
+            current_bytes += text_bytes
+        elif restart_prefix is _PIECE_OPTIONAL:
+            if current_bytes + text_bytes + footer_bytes < max_bytes:
+                current_parts.append(text)
+                current_bytes += text_bytes
+        elif current_bytes + text_bytes + footer_bytes >= max_bytes:
+            # Current batch can't fit, start new batch
+            if current_batch_has_content:
+                batches.append("".join(current_parts) + base_footer)
+            restart_bytes = prefix_bytes.get(restart_prefix)
+            if restart_bytes is None:
+                restart_bytes = prefix_bytes[restart_prefix] = _utf8_len(restart_prefix)
+            current_parts = [restart_prefix, text]
+            current_bytes = restart_bytes + text_bytes
+            current_batch_has_content = True
+        else:
+            current_parts.append(text)
+            current_bytes += text_bytes
+            current_batch_has_content = True
 
     # Complete last batch
     if current_batch_has_content:
-        batches.append(current_batch + base_footer)
+        batches.append("".join(current_parts) + base_footer)
 
     return batches
 
 
+def _dump_json(payload: Dict) -> bytes:
+    """Serialize a webhook JSON payload to UTF-8 bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _post_with_retry(url: str, **kwargs) -> requests.Response:
+    """POST through the thread's session, retrying once after 1s on connection errors
+
+    Read timeouts are not retried: the webhook may already have accepted
+    the message, and a retry would push it twice.
+    """
+    try:
+        return _http_session().post(url, **kwargs)
+    except requests.exceptions.ConnectionError as e:
+        print(f"Request connection failed, retrying in 1s: {e}")
+        time.sleep(1)
+        return _http_session().post(url, **kwargs)
+
+
+def _sleep_until_next_batch(batch_started: float, interval: float) -> None:
+    """Wait out the batch send interval, counted from when the previous batch was sent
+
+    The request round trip already counts towards the interval, so the next
+    batch isn't delayed by the full interval on top of the network time.
+    """
+    remaining = interval - (time.monotonic() - batch_started)
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+class _SenderOutput:
+    """
+    sys.stdout stand-in while notification senders run side by side
+
+    Output from a thread that called capture() is held back and written in
+    one piece by release(), so each channel's log lines stay together.
+    Other threads write straight through.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+    def capture(self) -> None:
+        self._local.buffer = []
+
+    def release(self) -> None:
+        text = "".join(self._local.buffer)
+        self._local.buffer = None
+        with self._write_lock:
+            self._stream.write(text)
+            self._stream.flush()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            return self._stream.write(text)
+        buffer.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        if getattr(self._local, "buffer", None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _run_senders(senders: Dict[str, Callable[[], bool]]) -> Dict[str, bool]:
+    """Run notification senders concurrently, printing each one's output when it finishes"""
+    if len(senders) == 1:
+        return {channel: sender() for channel, sender in senders.items()}
+
+    output = _SenderOutput(sys.stdout)
+
+    def run(sender: Callable[[], bool]) -> bool:
+        output.capture()
+        try:
+            return sender()
+        finally:
+            output.release()
+
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(senders)) as executor:
+            futures = {
+                channel: executor.submit(run, sender) for channel, sender in senders.items()
+            }
+    finally:
+        sys.stdout = output._stream
+    return {channel: future.result() for channel, future in futures.items()}
+
+
 def send_to_notifications(
     stats: List[Dict],
     failed_ids: Optional[List] = None,
@@ -3736,27 +3903,35 @@ def send_to_notifications(
 
     update_info_to_send = update_info if CONFIG["SHOW_VERSION_UPDATE"] else None
 
+    # Collect the configured channels first, then send to all of them
+    # concurrently. Batches within one channel are still sent in order
+    senders = {}
+
     # Send to Feishu
     if feishu_url:
-        results["feishu"] = send_to_feishu(
+        senders["feishu"] = partial(
+            send_to_feishu,
             feishu_url, report_data, report_type, update_info_to_send, proxy_url, mode
         )
 
     # Send to DingTalk
     if dingtalk_url:
-        results["dingtalk"] = send_to_dingtalk(
+        senders["dingtalk"] = partial(
+            send_to_dingtalk,
             dingtalk_url, report_data, report_type, update_info_to_send, proxy_url, mode
         )
 
     # Send to WeCom
     if wework_url:
-        results["wework"] = send_to_wework(
+        senders["wework"] = partial(
+            send_to_wework,
             wework_url, report_data, report_type, update_info_to_send, proxy_url, mode
         )
 
     # Send to Telegram
     if telegram_token and telegram_chat_id:
-        results["telegram"] = send_to_telegram(
+        senders["telegram"] = partial(
+            send_to_telegram,
             telegram_token,
             telegram_chat_id,
             report_data,
@@ -3768,7 +3943,8 @@ def send_to_notifications(
 
     # Send to ntfy
     if ntfy_server_url and ntfy_topic:
-        results["ntfy"] = send_to_ntfy(
+        senders["ntfy"] = partial(
+            send_to_ntfy,
             ntfy_server_url,
             ntfy_topic,
             ntfy_token,
@@ -3781,7 +3957,8 @@ def send_to_notifications(
 
     # Send to Bark
     if bark_url:
-        results["bark"] = send_to_bark(
+        senders["bark"] = partial(
+            send_to_bark,
             bark_url,
             report_data,
             report_type,
@@ -3792,7 +3969,8 @@ def send_to_notifications(
 
     # Send to Slack
     if slack_webhook_url:
-        results["slack"] = send_to_slack(
+        senders["slack"] = partial(
+            send_to_slack,
             slack_webhook_url,
             report_data,
             report_type,
@@ -3803,7 +3981,8 @@ def send_to_notifications(
 
     # Send email
     if email_from and email_password and email_to:
-        results["email"] = send_to_email(
+        senders["email"] = partial(
+            send_to_email,
             email_from,
             email_password,
             email_to,
@@ -3815,7 +3994,8 @@ def send_to_notifications(
 
     # Send via Resend
     if resend_api_key and resend_from_email and resend_to_email:
-        results["resend"] = send_to_resend(
+        senders["resend"] = partial(
+            send_to_resend,
             resend_api_key,
             resend_from_email,
             resend_to_email,
@@ -3823,6 +4003,9 @@ def send_to_notifications(
             html_file_path,
         )
 
+    if senders:
+        results = _run_senders(senders)
+
     if not results:
         print("No notification channels configured, skipping notification")
 
@@ -3838,6 +4021,60 @@ def send_to_notifications(
     return results
 
 
+def _send_batches(
+    provider_name: str,
+    url: str,
+    batches: List[str],
+    build_payload: Callable[[str], Tuple[Dict, str]],
+    check_response: Callable[[requests.Response], Optional[str]],
+    report_type: str,
+    proxies: Optional[Dict] = None,
+) -> bool:
+    """Post batches to a JSON webhook in order, stopping at the first failure
+
+    build_payload returns (payload, sent text) for a batch, the sent text is
+    only used for the size log. check_response returns None on success or
+    an error message.
+    """
+    total_batches = len(batches)
+    print(f"{provider_name} message split into {total_batches} batches [{report_type}]")
+
+    # Send batch by batch
+    for i, batch_content in enumerate(batches, 1):
+        payload, sent_text = build_payload(batch_content)
+        print(
+            f"Sending {provider_name} batch {i}/{total_batches}, size: {_utf8_len(sent_text)} bytes [{report_type}]"
+        )
+
+        batch_started = time.monotonic()
+        try:
+            response = _post_with_retry(
+                url,
+                headers={"Content-Type": "application/json"},
+                data=_dump_json(payload),
+                proxies=proxies,
+                timeout=CONFIG["HTTP_TIMEOUT_SLOW"],
+            )
+            error = check_response(response)
+        except Exception as e:
+            print(f"{provider_name} batch {i}/{total_batches} error [{report_type}]：{e}")
+            return False
+
+        if error is not None:
+            print(
+                f"{provider_name} batch {i}/{total_batches} failed [{report_type}]，error:{error}"
+            )
+            return False
+
+        print(f"{provider_name} batch {i}/{total_batches} sent successfully [{report_type}]")
+        # Interval between batches
+        if i < total_batches:
+            _sleep_until_next_batch(batch_started, CONFIG["BATCH_SEND_INTERVAL"])
+
+    print(f"{provider_name} all {total_batches} batches completed [{report_type}]")
+    return True
+
+
 def send_to_feishu(
     webhook_url: str,
     report_data: Dict,
@@ -3847,7 +4084,6 @@ def send_to_feishu(
     mode: str = "daily",
 ) -> bool:
     """Send to Feishu (supports batch sending)"""
-    headers = {"Content-Type": "application/json"}
     proxies = None
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
@@ -3867,59 +4103,34 @@ def send_to_feishu(
     # Add batch headers uniformly (space already reserved, won't exceed limit)
     batches = add_batch_headers(batches, "feishu", feishu_batch_size)
 
-    print(f"Feishu message split into {len(batches)} batches [{report_type}]")
-
-    # Send batch by batch
-    for i, batch_content in enumerate(batches, 1):
-        batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"Sending Feishu batch {i}/{len(batches)}, size: {batch_size} bytes [{report_type}]"
-        )
-
-        total_titles = sum(
-            len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
-        )
-        now = get_beijing_time()
+    total_titles = sum(
+        len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
+    )
 
+    def build_payload(batch_content: str) -> Tuple[Dict, str]:
         payload = {
             "msg_type": "text",
             "content": {
                 "total_titles": total_titles,
-                "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": get_beijing_time().strftime("%Y-%m-%d %H:%M:%S"),
                 "report_type": report_type,
                 "text": batch_content,
             },
         }
+        return payload, batch_content
+
+    def check_response(response: requests.Response) -> Optional[str]:
+        if response.status_code != 200:
+            return f"status code:{response.status_code}"
+        result = response.json()
+        # Check Feishu response status
+        if result.get("StatusCode") == 0 or result.get("code") == 0:
+            return None
+        return result.get("msg") or result.get("StatusMessage", "Unknown error")
 
-        try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                # Check Feishu response status
-                if result.get("StatusCode") == 0 or result.get("code") == 0:
-                    print(f"Feishu batch {i}/{len(batches)} sent successfully [{report_type}]")
-                    # Interval between batches
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    error_msg = result.get("msg") or result.get("StatusMessage", "Unknown error")
-                    print(
-                        f"Feishu batch {i}/{len(batches)} failed [{report_type}], error: {error_msg}"
-                    )
-                    return False
-            else:
-                print(
-                    f"Feishu batch {i}/{len(batches)} failed [{report_type}]，status code:{response.status_code}"
-                )
-                return False
-        except Exception as e:
-            print(f"Feishu batch {i}/{len(batches)} error [{report_type}]：{e}")
-            return False
-
-    print(f"Feishu all {len(batches)} batches completed [{report_type}]")
-    return True
+    return _send_batches(
+        "Feishu", webhook_url, batches, build_payload, check_response, report_type, proxies
+    )
 
 
 def send_to_dingtalk(
@@ -3931,7 +4142,6 @@ def send_to_dingtalk(
     mode: str = "daily",
 ) -> bool:
     """Send to DingTalk (supports batch sending)"""
-    headers = {"Content-Type": "application/json"}
     proxies = None
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
@@ -3951,15 +4161,7 @@ def send_to_dingtalk(
     # Add batch headers uniformly (space already reserved, won't exceed limit)
     batches = add_batch_headers(batches, "dingtalk", dingtalk_batch_size)
 
-    print(f"DingTalk message split into {len(batches)} batches [{report_type}]")
-
-    # Send batch by batch
-    for i, batch_content in enumerate(batches, 1):
-        batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"SendingDingTalk batch {i}/{len(batches)} , size:{batch_size} bytes [{report_type}]"
-        )
-
+    def build_payload(batch_content: str) -> Tuple[Dict, str]:
         payload = {
             "msgtype": "markdown",
             "markdown": {
@@ -3967,76 +4169,93 @@ def send_to_dingtalk(
                 "text": batch_content,
             },
         }
+        return payload, batch_content
 
-        try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("errcode") == 0:
-                    print(f"DingTalk batch {i}/{len(batches)} sent successfully [{report_type}]")
-                    # Interval between batches
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    print(
-                        f"DingTalk batch {i}/{len(batches)} failed [{report_type}]，error:{result.get('errmsg')}"
-                    )
-                    return False
-            else:
-                print(
-                    f"DingTalk batch {i}/{len(batches)} failed [{report_type}]，status code:{response.status_code}"
-                )
-                return False
-        except Exception as e:
-            print(f"DingTalk batch {i}/{len(batches)} error [{report_type}]：{e}")
-            return False
-
-    print(f"DingTalk all {len(batches)} batches completed [{report_type}]")
-    return True
-
-
-def strip_markdown(text: str) -> str:
-    """Remove markdown syntax from text, for personal WeChat push"""
-
-    # Remove bold **text** or __text__
-    text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-    text = re.sub(r'__(.+?)__', r'\1', text)
-
-    # Remove italic *text* or _text_
-    text = re.sub(r'\*(.+?)\*', r'\1', text)
-    text = re.sub(r'_(.+?)_', r'\1', text)
-
-    # Remove strikethrough ~~text~~
-    text = re.sub(r'~~(.+?)~~', r'\1', text)
+    def check_response(response: requests.Response) -> Optional[str]:
+        if response.status_code != 200:
+            return f"status code:{response.status_code}"
+        result = response.json()
+        if result.get("errcode") == 0:
+            return None
+        return result.get("errmsg") or f"errcode:{result.get('errcode')}"
 
-    # Convert link [text](url) -> text url (keep URL)
-    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'\1 \2', text)
-    # If URL not needed, use this line instead (keep title text only):
-    # text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
+    return _send_batches(
+        "DingTalk", webhook_url, batches, build_payload, check_response, report_type, proxies
+    )
 
-    # Remove image ![alt](url) -> alt
-    text = re.sub(r'!\[(.+?)\]\(.+?\)', r'\1', text)
 
-    # Remove inline code `code`
-    text = re.sub(r'`(.+?)`', r'\1', text)
+# Inline markdown/HTML constructs removed by strip_markdown, matched in a
+# single pass. Only one alternative matches at a time, the callback keeps
+# the inner text (stripping any markup nested inside it)
+_MARKDOWN_INLINE_PATTERN = (
+    # Bold **text** or __text__
+    r'\*\*(?P<bold>.+?)\*\*'
+    r'|__(?P<bold_underscore>.+?)__'
+    # Italic *text* or _text_
+    r'|\*(?P<italic>.+?)\*'
+    r'|_(?P<italic_underscore>.+?)_'
+    # Strikethrough ~~text~~
+    r'|~~(?P<strike>.+?)~~'
+    # Link [text](url) -> text url (keep URL)
+    r'|\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^)]+)\)'
+    # Image ![alt](url) -> alt
+    r'|!\[(?P<image_alt>.+?)\]\(.+?\)'
+    # Inline code `code`
+    r'|`(?P<code>.+?)`'
+)
+_RE_MARKDOWN_INLINE = re.compile(
+    _MARKDOWN_INLINE_PATTERN
+    # HTML tags <font color='xxx'>text</font> -> text, other tags removed
+    + r'|<font[^>]*>(?P<font>.+?)</font>'
+    + r'|<[^>]+>'
+)
+# Same pass without the HTML alternatives, for the common case of text
+# with no "<" at all
+_RE_MARKDOWN_INLINE_NO_HTML = re.compile(_MARKDOWN_INLINE_PATTERN)
+
+# Line-anchored markdown removal, applied after the inline pass.
+# Quote symbol > and heading symbols # ## ### are removed in one pass, a
+# heading right after a quote is removed along with it
+_RE_MARKDOWN_LINE_PREFIX = re.compile(r'^(?:>\s*(?:#+\s*)?|#+\s*)', re.MULTILINE)
+# Horizontal divider --- or ***. Kept as its own pass: whether "$" matches
+# depends on the line content left after the prefixes are removed
+_RE_MARKDOWN_DIVIDER = re.compile(r'^[\-\*]{3,}\s*$', re.MULTILINE)
+
+_RE_EXTRA_BLANK_LINES = re.compile(r'\n{3,}')
+
+# Characters any of the markdown rules above needs to match
+_MARKDOWN_SIGILS = frozenset("*_~`[<>#-")
+
+
+def _strip_inline_markdown(match: "re.Match") -> str:
+    """re.sub callback for _RE_MARKDOWN_INLINE"""
+    group = match.lastgroup
+    if group is None:
+        # Bare HTML tag
+        return ""
+    if group == "link_url":
+        # If URL not needed, return the link text only
+        link_text = _RE_MARKDOWN_INLINE.sub(_strip_inline_markdown, match["link_text"])
+        return f"{link_text} {match['link_url']}"
+    return _RE_MARKDOWN_INLINE.sub(_strip_inline_markdown, match[group])
 
-    # Remove quote symbol >
-    text = re.sub(r'^>\s*', '', text, flags=re.MULTILINE)
 
-    # Remove heading symbols # ## ### etc
-    text = re.sub(r'^#+\s*', '', text, flags=re.MULTILINE)
+def strip_markdown(text: str) -> str:
+    """Remove markdown syntax from text, for personal WeChat push"""
+    if _MARKDOWN_SIGILS.isdisjoint(text):
+        # Plain text, only blank lines need cleaning up
+        if "\n\n\n" in text:
+            text = _RE_EXTRA_BLANK_LINES.sub('\n\n', text)
+        return text.strip()
 
-    # Remove horizontal divider --- or ***
-    text = re.sub(r'^[\-\*]{3,}\s*$', '', text, flags=re.MULTILINE)
+    inline_re = _RE_MARKDOWN_INLINE if "<" in text else _RE_MARKDOWN_INLINE_NO_HTML
+    text = inline_re.sub(_strip_inline_markdown, text)
 
-    # Remove HTML tags <font color='xxx'>text</font> -> text
-    text = re.sub(r'<font[^>]*>(.+?)</font>', r'\1', text)
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _RE_MARKDOWN_LINE_PREFIX.sub('', text)
+    text = _RE_MARKDOWN_DIVIDER.sub('', text)
 
     # Clean up extra blank lines (keep max two consecutive blank lines)
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _RE_EXTRA_BLANK_LINES.sub('\n\n', text)
 
     return text.strip()
 
@@ -4050,7 +4269,6 @@ def send_to_wework(
     mode: str = "daily",
 ) -> bool:
     """Send to WeCom (supports batch sending, supports markdown and text formats)"""
-    headers = {"Content-Type": "application/json"}
     proxies = None
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
@@ -4077,52 +4295,26 @@ def send_to_wework(
     # Add batch headers uniformly (space already reserved, won't exceed limit)
     batches = add_batch_headers(batches, header_format_type, wework_batch_size)
 
-    print(f"WeCom message split into {len(batches)} batches [{report_type}]")
-
-    # Send batch by batch
-    for i, batch_content in enumerate(batches, 1):
+    def build_payload(batch_content: str) -> Tuple[Dict, str]:
         # Build payload based on message type
         if is_text_mode:
             # text format: remove markdown syntax
             plain_content = strip_markdown(batch_content)
-            payload = {"msgtype": "text", "text": {"content": plain_content}}
-            batch_size = len(plain_content.encode("utf-8"))
-        else:
-            # markdown format: keep as is
-            payload = {"msgtype": "markdown", "markdown": {"content": batch_content}}
-            batch_size = len(batch_content.encode("utf-8"))
-
-        print(
-            f"SendingWeCom batch {i}/{len(batches)} , size:{batch_size} bytes [{report_type}]"
-        )
-
-        try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("errcode") == 0:
-                    print(f"WeCom batch {i}/{len(batches)} sent successfully [{report_type}]")
-                    # Interval between batches
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    print(
-                        f"WeCom batch {i}/{len(batches)} failed [{report_type}]，error:{result.get('errmsg')}"
-                    )
-                    return False
-            else:
-                print(
-                    f"WeCom batch {i}/{len(batches)} failed [{report_type}]，status code:{response.status_code}"
-                )
-                return False
-        except Exception as e:
-            print(f"WeCom batch {i}/{len(batches)} error [{report_type}]：{e}")
-            return False
+            return {"msgtype": "text", "text": {"content": plain_content}}, plain_content
+        # markdown format: keep as is
+        return {"msgtype": "markdown", "markdown": {"content": batch_content}}, batch_content
+
+    def check_response(response: requests.Response) -> Optional[str]:
+        if response.status_code != 200:
+            return f"status code:{response.status_code}"
+        result = response.json()
+        if result.get("errcode") == 0:
+            return None
+        return result.get("errmsg") or f"errcode:{result.get('errcode')}"
 
-    print(f"WeCom all {len(batches)} batches completed [{report_type}]")
-    return True
+    return _send_batches(
+        "WeCom", webhook_url, batches, build_payload, check_response, report_type, proxies
+    )
 
 
 def send_to_telegram(
@@ -4135,7 +4327,6 @@ def send_to_telegram(
     mode: str = "daily",
 ) -> bool:
     """Send to Telegram (supports batch sending)"""
-    headers = {"Content-Type": "application/json"}
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
 
     proxies = None
@@ -4152,49 +4343,106 @@ def send_to_telegram(
     # Add batch headers uniformly (space already reserved, won't exceed limit)
     batches = add_batch_headers(batches, "telegram", telegram_batch_size)
 
-    print(f"Telegram message split into {len(batches)} batches [{report_type}]")
-
-    # Send batch by batch
-    for i, batch_content in enumerate(batches, 1):
-        batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"SendingTelegram batch {i}/{len(batches)} , size:{batch_size} bytes [{report_type}]"
-        )
-
+    def build_payload(batch_content: str) -> Tuple[Dict, str]:
         payload = {
             "chat_id": chat_id,
             "text": batch_content,
             "parse_mode": "HTML",
             "disable_web_page_preview": True,
         }
+        return payload, batch_content
+
+    def check_response(response: requests.Response) -> Optional[str]:
+        if response.status_code != 200:
+            return f"status code:{response.status_code}"
+        result = response.json()
+        if result.get("ok"):
+            return None
+        return result.get("description") or "Unknown error"
+
+    return _send_batches(
+        "Telegram", url, batches, build_payload, check_response, report_type, proxies
+    )
+
+
+# Authenticated SMTP connections kept open for the rest of the run, keyed by
+# (server, port, sender), so later reports in the same run skip the
+# connect/STARTTLS/login handshake
+_SMTP_CONNECTIONS = {}
 
+
+def _get_smtp_connection(
+    smtp_server: str, smtp_port: int, use_tls: bool, from_email: str, password: str
+):
+    """Get a logged-in SMTP connection, reusing a still-alive pooled one"""
+    import smtplib
+
+    key = (smtp_server, smtp_port, from_email)
+    server = _SMTP_CONNECTIONS.get(key)
+    if server is not None:
         try:
-            response = requests.post(
-                url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("ok"):
-                    print(f"Telegram batch {i}/{len(batches)} sent successfully [{report_type}]")
-                    # Interval between batches
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    print(
-                        f"Telegram batch {i}/{len(batches)} failed [{report_type}]，error:{result.get('description')}"
-                    )
-                    return False
-            else:
-                print(
-                    f"Telegram batch {i}/{len(batches)} failed [{report_type}]，status code:{response.status_code}"
-                )
-                return False
-        except Exception as e:
-            print(f"Telegram batch {i}/{len(batches)} error [{report_type}]：{e}")
-            return False
+            if server.noop()[0] == 250:
+                return server
+        except (smtplib.SMTPException, OSError):
+            pass
+        _discard_smtp_connection(smtp_server, smtp_port, from_email)
+
+    if use_tls:
+        # TLS mode
+        server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
+        server.set_debuglevel(0)  # Set to 1 for detailed debug info
+        server.ehlo()
+        server.starttls()
+        server.ehlo()
+    else:
+        # SSL mode
+        server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
+        server.set_debuglevel(0)
+        server.ehlo()
 
-    print(f"Telegramall {len(batches)} batches completed [{report_type}]")
-    return True
+    # Login
+    server.login(from_email, password)
+
+    _SMTP_CONNECTIONS[key] = server
+    return server
+
+
+def _discard_smtp_connection(smtp_server: str, smtp_port: int, from_email: str) -> None:
+    """Drop a pooled SMTP connection, closing it quietly"""
+    server = _SMTP_CONNECTIONS.pop((smtp_server, smtp_port, from_email), None)
+    if server is not None:
+        try:
+            server.close()
+        except Exception:
+            pass
+
+
+def _close_smtp_connections() -> None:
+    """Log out of all pooled SMTP connections at process exit"""
+    for server in list(_SMTP_CONNECTIONS.values()):
+        try:
+            server.quit()
+        except Exception:
+            pass
+    _SMTP_CONNECTIONS.clear()
+
+
+atexit.register(_close_smtp_connections)
+
+
+@lru_cache(maxsize=4)
+def _read_html_report_cached(html_file_path: str, mtime_ns: int) -> str:
+    return Path(html_file_path).read_bytes().decode("utf-8")
+
+
+def _read_html_report(html_file_path: str) -> str:
+    """Read an HTML report for email, cached per (path, mtime)
+
+    SMTP email and Resend attach the same report, read it from disk once.
+    """
+    return _read_html_report_cached(
+        html_file_path, os.stat(html_file_path).st_mtime_ns
+    )
 
 
 def send_to_email(
@@ -4207,14 +4455,20 @@ def send_to_email(
     custom_smtp_port: Optional[int] = None,
 ) -> bool:
     """Send email notification"""
+    # Only needed for email, imported here to keep startup light
+    import smtplib
+    from email.header import Header
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+    from email.utils import formataddr, formatdate, make_msgid
+
     try:
         if not html_file_path or not Path(html_file_path).exists():
             print(f"Error: HTML file does not exist or not provided: {html_file_path}")
             return False
 
         print(f"Using HTML file: {html_file_path}")
-        with open(html_file_path, "r", encoding="utf-8") as f:
-            html_content = f.read()
+        html_content = _read_html_report(html_file_path)
 
         domain = from_email.split("@")[-1].lower()
 
@@ -4285,25 +4539,17 @@ Please use an HTML-supported email client to view the full report.
         print(f"Sender: {from_email}")
 
         try:
-            if use_tls:
-                # TLS mode
-                server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
-                server.set_debuglevel(0)  # Set to 1 for detailed debug info
-                server.ehlo()
-                server.starttls()
-                server.ehlo()
-            else:
-                # SSL mode
-                server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
-                server.set_debuglevel(0)
-                server.ehlo()
-
-            # Login
-            server.login(from_email, password)
+            server = _get_smtp_connection(
+                smtp_server, smtp_port, use_tls, from_email, password
+            )
 
             # Send email
-            server.send_message(msg)
-            server.quit()
+            try:
+                server.send_message(msg)
+            except Exception:
+                # Don't reuse a connection left in an unknown state
+                _discard_smtp_connection(smtp_server, smtp_port, from_email)
+                raise
 
             print(f"Email sent successfully [{report_type}] -> {to_email}")
             return True
@@ -4345,7 +4591,10 @@ def send_to_resend(
     html_file_path: str,
 ) -> bool:
     """Send email notification via Resend API"""
-    if not RESEND_AVAILABLE:
+    # Optional dependency, only imported when Resend is configured
+    try:
+        import resend
+    except ImportError:
         print("Error: resend package not installed. Run: pip install resend")
         return False
 
@@ -4355,8 +4604,7 @@ def send_to_resend(
             return False
 
         print(f"Using HTML file: {html_file_path}")
-        with open(html_file_path, "r", encoding="utf-8") as f:
-            html_content = f.read()
+        html_content = _read_html_report(html_file_path)
 
         # Set API key
         resend.api_key = api_key
@@ -4448,6 +4696,8 @@ def send_to_ntfy(
     # Add batch headers uniformly (space already reserved, won't exceed limit)
     batches = add_batch_headers(batches, "ntfy", ntfy_batch_size)
 
+    # Batches can't be merged into fewer requests: split_content_into_batches
+    # packs greedily, so two adjacent batches never fit into one together
     total_batches = len(batches)
     print(f"ntfy message split into {total_batches} batches [{report_type}]")
 
@@ -4463,15 +4713,13 @@ def send_to_ntfy(
         # Calculate correct batch number (from user's perspective)
         actual_batch_num = total_batches - idx + 1
 
-        batch_size = len(batch_content.encode("utf-8"))
+        # Encode once, used both for the size log and as the request body
+        batch_body = batch_content.encode("utf-8")
+        batch_size = len(batch_body)
         print(
             f"Sendingntfy batch {actual_batch_num}/{total_batches} (push order: {idx}/{total_batches}), size:{batch_size} bytes [{report_type}]"
         )
 
-        # Check message size, ensure no more than 4KB
-        if batch_size > 4096:
-            print(f"Warning:ntfy batch {actual_batch_num} batch message too large ({batch_size} bytes), may be rejected")
-
         # Update batch identifier in headers
         current_headers = headers.copy()
         if total_batches > 1:
@@ -4479,13 +4727,14 @@ def send_to_ntfy(
                 f"{report_type_en} ({actual_batch_num}/{total_batches})"
             )
 
+        batch_started = time.monotonic()
         try:
-            response = requests.post(
+            response = _post_with_retry(
                 url,
                 headers=current_headers,
-                data=batch_content.encode("utf-8"),
+                data=batch_body,
                 proxies=proxies,
-                timeout=30,
+                timeout=CONFIG["HTTP_TIMEOUT_FAST"],
             )
 
             if response.status_code == 200:
@@ -4494,19 +4743,19 @@ def send_to_ntfy(
                 if idx < total_batches:
                     # Public servers recommend 2-3 seconds, self-hosted can be shorter
                     interval = 2 if "ntfy.sh" in server_url else 1
-                    time.sleep(interval)
+                    _sleep_until_next_batch(batch_started, interval)
             elif response.status_code == 429:
                 print(
                     f"ntfy batch {actual_batch_num}/{total_batches} rate limited [{report_type}], waiting to retry"
                 )
                 time.sleep(10)  # Wait 10 seconds before retry
                 # Retry once
-                retry_response = requests.post(
+                retry_response = _post_with_retry(
                     url,
                     headers=current_headers,
-                    data=batch_content.encode("utf-8"),
+                    data=batch_body,
                     proxies=proxies,
-                    timeout=30,
+                    timeout=CONFIG["HTTP_TIMEOUT_FAST"],
                 )
                 if retry_response.status_code == 200:
                     print(f"ntfy batch {actual_batch_num}/{total_batches} retry successful [{report_type}]")
@@ -4549,6 +4798,17 @@ def send_to_ntfy(
         return False
 
 
+@lru_cache(maxsize=4)
+def _parse_bark_url(bark_url: str) -> Tuple[str, Optional[str]]:
+    """Parse Bark URL into (API endpoint, device_key)"""
+    # Bark URL format: https://api.day.app/device_key or https://bark.day.app/device_key
+    from urllib.parse import urlparse
+
+    parsed_url = urlparse(bark_url)
+    device_key = parsed_url.path.strip('/').split('/')[0] if parsed_url.path else None
+    return f"{parsed_url.scheme}://{parsed_url.netloc}/push", device_key
+
+
 def send_to_bark(
     bark_url: str,
     report_data: Dict,
@@ -4562,22 +4822,19 @@ def send_to_bark(
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
 
-    # Parse Bark URL, extract device_key and API endpoint
-    # Bark URL format: https://api.day.app/device_key or https://bark.day.app/device_key
-    from urllib.parse import urlparse
-
-    parsed_url = urlparse(bark_url)
-    device_key = parsed_url.path.strip('/').split('/')[0] if parsed_url.path else None
-
+    api_endpoint, device_key = _parse_bark_url(bark_url)
     if not device_key:
         print(f"Bark URL format error, unable to extract device_key: {bark_url}")
         return False
 
-    # Build correct API endpoint
-    api_endpoint = f"{parsed_url.scheme}://{parsed_url.netloc}/push"
-
     # Get batch content (Bark limit is 3600 bytes to avoid 413 error), reserve space for batch header
     bark_batch_size = CONFIG["BARK_BATCH_SIZE"]
+    # add_batch_headers caps every batch at bark_batch_size, so the APNs 4KB
+    # limit can only be exceeded when the configured size itself is above it
+    if bark_batch_size > 4096:
+        print(
+            f"Warning:bark_batch_size ({bark_batch_size} bytes) exceeds the 4KB APNs limit, batches may be rejected"
+        )
     header_reserve = _get_max_batch_header_size("bark")
     batches = split_content_into_batches(
         report_data, "bark", update_info, max_bytes=bark_batch_size - header_reserve, mode=mode
@@ -4586,6 +4843,8 @@ def send_to_bark(
     # Add batch headers uniformly (space already reserved, won't exceed limit)
     batches = add_batch_headers(batches, "bark", bark_batch_size)
 
+    # Batches can't be merged into fewer requests: split_content_into_batches
+    # packs greedily, so two adjacent batches never fit into one together
     total_batches = len(batches)
     print(f"Bark message split into {total_batches} batches [{report_type}]")
 
@@ -4601,17 +4860,11 @@ def send_to_bark(
         # Calculate correct batch number (from user's perspective)
         actual_batch_num = total_batches - idx + 1
 
-        batch_size = len(batch_content.encode("utf-8"))
+        batch_size = _utf8_len(batch_content)
         print(
             f"SendingBark batch {actual_batch_num}/{total_batches} (push order: {idx}/{total_batches}), size:{batch_size} bytes [{report_type}]"
         )
 
-        # Check message size (Bark uses APNs, 4KB limit)
-        if batch_size > 4096:
-            print(
-                f"Warning:Bark batch {actual_batch_num}/{total_batches} batch message too large ({batch_size} bytes), may be rejected"
-            )
-
         # Build JSON payload
         payload = {
             "title": report_type,
@@ -4622,12 +4875,14 @@ def send_to_bark(
             "action": "none",  # Click notification goes to app without popup for easy reading
         }
 
+        batch_started = time.monotonic()
         try:
-            response = requests.post(
+            response = _post_with_retry(
                 api_endpoint,
-                json=payload,
+                headers={"Content-Type": "application/json"},
+                data=_dump_json(payload),
                 proxies=proxies,
-                timeout=30,
+                timeout=CONFIG["HTTP_TIMEOUT_FAST"],
             )
 
             if response.status_code == 200:
@@ -4637,7 +4892,7 @@ def send_to_bark(
                     success_count += 1
                     # Interval between batches
                     if idx < total_batches:
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
+                        _sleep_until_next_batch(batch_started, CONFIG["BATCH_SEND_INTERVAL"])
                 else:
                     print(
                         f"Bark batch {actual_batch_num}/{total_batches} failed [{report_type}]，error:{result.get('message', 'Unknown error')}"
@@ -4672,6 +4927,10 @@ def send_to_bark(
         return False
 
 
+_RE_MARKDOWN_LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_RE_MARKDOWN_BOLD = re.compile(r'\*\*([^*]+)\*\*')
+
+
 def convert_markdown_to_mrkdwn(content: str) -> str:
     """
     Convert standard Markdown to Slack's mrkdwn format
@@ -4682,10 +4941,12 @@ def convert_markdown_to_mrkdwn(content: str) -> str:
     - Keep other formats (code blocks, lists, etc.)
     """
     # 1. Convert link format: [text](url) → <url|text>
-    content = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<\2|\1>', content)
+    if "[" in content:
+        content = _RE_MARKDOWN_LINK.sub(r'<\2|\1>', content)
 
     # 2. Convert bold: **text** → *text*
-    content = re.sub(r'\*\*([^*]+)\*\*', r'*\1*', content)
+    if "**" in content:
+        content = _RE_MARKDOWN_BOLD.sub(r'*\1*', content)
 
     return content
 
@@ -4699,7 +4960,6 @@ def send_to_slack(
     mode: str = "daily",
 ) -> bool:
     """Send to Slack (supports batch sending, uses mrkdwn format)"""
-    headers = {"Content-Type": "application/json"}
     proxies = None
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
@@ -4714,52 +4974,52 @@ def send_to_slack(
     # Add batch headers uniformly (space already reserved, won't exceed limit)
     batches = add_batch_headers(batches, "slack", slack_batch_size)
 
-    print(f"Slack message split into {len(batches)} batches [{report_type}]")
-
-    # Send batch by batch
-    for i, batch_content in enumerate(batches, 1):
+    def build_payload(batch_content: str) -> Tuple[Dict, str]:
         # Convert Markdown to mrkdwn format
         mrkdwn_content = convert_markdown_to_mrkdwn(batch_content)
-
-        batch_size = len(mrkdwn_content.encode("utf-8"))
-        print(
-            f"SendingSlack batch {i}/{len(batches)} , size:{batch_size} bytes [{report_type}]"
-        )
-
         # Build Slack payload (use simple text field, supports mrkdwn)
-        payload = {
-            "text": mrkdwn_content
-        }
+        return {"text": mrkdwn_content}, mrkdwn_content
 
-        try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-
-            # Slack Incoming Webhooks returns "ok" text on success
-            if response.status_code == 200 and response.text == "ok":
-                print(f"Slack batch {i}/{len(batches)} sent successfully [{report_type}]")
-                # Interval between batches
-                if i < len(batches):
-                    time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-            else:
-                error_msg = response.text if response.text else f"status code:{response.status_code}"
-                print(
-                    f"Slack batch {i}/{len(batches)} failed [{report_type}]，error:{error_msg}"
-                )
-                return False
-        except Exception as e:
-            print(f"Slack batch {i}/{len(batches)} error [{report_type}]：{e}")
-            return False
+    def check_response(response: requests.Response) -> Optional[str]:
+        # Slack Incoming Webhooks returns "ok" text on success
+        if response.status_code == 200 and response.text == "ok":
+            return None
+        return response.text if response.text else f"status code:{response.status_code}"
 
-    print(f"Slackall {len(batches)} batches completed [{report_type}]")
-    return True
+    return _send_batches(
+        "Slack", webhook_url, batches, build_payload, check_response, report_type, proxies
+    )
 
 
 # === Main Analyzer ===
+# Runtime environment, fixed for the lifetime of the process
+_IS_GITHUB_ACTIONS = os.environ.get("GITHUB_ACTIONS") == "true"
+_IS_DOCKER = os.environ.get("DOCKER_CONTAINER") == "true" or os.path.exists(
+    "/.dockerenv"
+)
+
+
 class NewsAnalyzer:
     """News Analyzer"""
 
+    __slots__ = (
+        "request_interval",
+        "report_mode",
+        "rank_threshold",
+        "is_github_actions",
+        "is_docker_container",
+        "update_info",
+        "proxy_url",
+        "data_fetcher",
+        "_platform_ids",
+        "_platform_crawl_ids",
+        "_platform_display_names",
+        "_has_notif",
+        "_analysis_cache",
+        "_analysis_cache_key",
+        "_mode_strategy",
+    )
+
     # Mode strategy definitions
     MODE_STRATEGIES = {
         "incremental": {
@@ -4794,30 +5054,35 @@ class NewsAnalyzer:
     def __init__(self):
         self.request_interval = CONFIG["REQUEST_INTERVAL"]
         self.report_mode = CONFIG["REPORT_MODE"]
+        self._mode_strategy = self.MODE_STRATEGIES.get(
+            self.report_mode, self.MODE_STRATEGIES["daily"]
+        )
         self.rank_threshold = CONFIG["RANK_THRESHOLD"]
-        self.is_github_actions = os.environ.get("GITHUB_ACTIONS") == "true"
-        self.is_docker_container = self._detect_docker_environment()
+        self.is_github_actions = _IS_GITHUB_ACTIONS
+        self.is_docker_container = _IS_DOCKER
+        # Platform list doesn't change during a run
+        self._platform_ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
+        self._platform_crawl_ids = [
+            (platform["id"], platform["name"]) if "name" in platform else platform["id"]
+            for platform in CONFIG["PLATFORMS"]
+        ]
+        self._platform_display_names = [
+            platform.get("name", platform["id"]) for platform in CONFIG["PLATFORMS"]
+        ]
         self.update_info = None
         self.proxy_url = None
+        # Result of the last _load_analysis_data call and the state of
+        # today's title files it was loaded from
+        self._analysis_cache = None
+        self._analysis_cache_key = None
+        # CONFIG doesn't change during a run
+        self._has_notif = self._has_notification_configured()
         self._setup_proxy()
         self.data_fetcher = DataFetcher(self.proxy_url)
 
         if self.is_github_actions:
             self._check_version_update()
 
-    def _detect_docker_environment(self) -> bool:
-        """Detect if running in Docker container"""
-        try:
-            if os.environ.get("DOCKER_CONTAINER") == "true":
-                return True
-
-            if os.path.exists("/.dockerenv"):
-                return True
-
-            return False
-        except Exception:
-            return False
-
     def _should_open_browser(self) -> bool:
         """Determine if browser should be opened"""
         return not self.is_github_actions and not self.is_docker_container
@@ -4852,54 +5117,57 @@ class NewsAnalyzer:
 
     def _get_mode_strategy(self) -> Dict:
         """Get strategy config for current mode"""
-        return self.MODE_STRATEGIES.get(self.report_mode, self.MODE_STRATEGIES["daily"])
+        return self._mode_strategy
 
     def _has_notification_configured(self) -> bool:
         """Check if any notification channel is configured"""
-        return any(
-            [
-                CONFIG["FEISHU_WEBHOOK_URL"],
-                CONFIG["DINGTALK_WEBHOOK_URL"],
-                CONFIG["WEWORK_WEBHOOK_URL"],
-                (CONFIG["TELEGRAM_BOT_TOKEN"] and CONFIG["TELEGRAM_CHAT_ID"]),
-                (
-                    CONFIG["EMAIL_FROM"]
-                    and CONFIG["EMAIL_PASSWORD"]
-                    and CONFIG["EMAIL_TO"]
-                ),
-                (CONFIG["NTFY_SERVER_URL"] and CONFIG["NTFY_TOPIC"]),
-                CONFIG["BARK_URL"],
-                CONFIG["SLACK_WEBHOOK_URL"],
-            ]
+        return bool(
+            CONFIG["FEISHU_WEBHOOK_URL"]
+            or CONFIG["DINGTALK_WEBHOOK_URL"]
+            or CONFIG["WEWORK_WEBHOOK_URL"]
+            or (CONFIG["TELEGRAM_BOT_TOKEN"] and CONFIG["TELEGRAM_CHAT_ID"])
+            or (
+                CONFIG["EMAIL_FROM"]
+                and CONFIG["EMAIL_PASSWORD"]
+                and CONFIG["EMAIL_TO"]
+            )
+            or (CONFIG["NTFY_SERVER_URL"] and CONFIG["NTFY_TOPIC"])
+            or CONFIG["BARK_URL"]
+            or CONFIG["SLACK_WEBHOOK_URL"]
         )
 
     def _has_valid_content(
         self, stats: List[Dict], new_titles: Optional[Dict] = None
     ) -> bool:
         """Check if there is valid news content"""
+        # Having stats means matching news exists
+        if any(stat["count"] > 0 for stat in stats):
+            return True
         if self.report_mode in ["incremental", "current"]:
-            # In incremental/current mode, having stats means matching news exists
-            return any(stat["count"] > 0 for stat in stats)
-        else:
-            # In daily summary mode, check for matched keywords or new news
-            has_matched_news = any(stat["count"] > 0 for stat in stats)
-            has_new_news = bool(
-                new_titles and any(len(titles) > 0 for titles in new_titles.values())
-            )
-            return has_matched_news or has_new_news
+            return False
+        # In daily summary mode, new news also counts
+        return bool(new_titles and any(new_titles.values()))
 
     def _load_analysis_data(
-        self,
+        self, new_titles: Optional[Dict] = None
     ) -> Optional[Tuple[Dict, Dict, Dict, Dict, List, List]]:
-        """Unified data loading and preprocessing, filter by current platform list"""
+        """Unified data loading and preprocessing, filter by current platform list
+
+        new_titles can be passed in when the caller already detected them.
+        """
         try:
             # Get current configured platform ID list
-            current_platform_ids = []
-            for platform in CONFIG["PLATFORMS"]:
-                current_platform_ids.append(platform["id"])
+            current_platform_ids = self._platform_ids
 
             print(f"Current monitored platforms: {current_platform_ids}")
 
+            # Reuse the previous load while today's title files are unchanged
+            # (current mode loads once for the realtime push, once for the summary)
+            cache_key = self._get_analysis_cache_key(current_platform_ids)
+            if self._analysis_cache is not None and cache_key == self._analysis_cache_key:
+                print("Today's data unchanged, reusing loaded data")
+                return self._analysis_cache
+
             all_results, id_to_name, title_info = read_all_today_titles(
                 current_platform_ids
             )
@@ -4911,10 +5179,11 @@ class NewsAnalyzer:
             total_titles = sum(len(titles) for titles in all_results.values())
             print(f"Loaded {total_titles} titles (filtered by current platforms)")
 
-            new_titles = detect_latest_new_titles(current_platform_ids)
+            if new_titles is None:
+                new_titles = detect_latest_new_titles(current_platform_ids)
             word_groups, filter_words = load_frequency_words()
 
-            return (
+            self._analysis_cache = (
                 all_results,
                 id_to_name,
                 title_info,
@@ -4922,29 +5191,37 @@ class NewsAnalyzer:
                 word_groups,
                 filter_words,
             )
+            self._analysis_cache_key = cache_key
+            return self._analysis_cache
         except Exception as e:
             print(f"Data loading failed: {e}")
             return None
 
+    def _get_analysis_cache_key(self, current_platform_ids: List[str]) -> Tuple:
+        """Identify the state of today's title files for the analysis cache"""
+        txt_dir = Path("output") / format_date_folder() / "txt"
+        if not txt_dir.exists():
+            return (tuple(current_platform_ids), str(txt_dir), 0, 0)
+
+        mtimes = [f.stat().st_mtime_ns for f in txt_dir.iterdir() if f.suffix == ".txt"]
+        return (tuple(current_platform_ids), str(txt_dir), len(mtimes), max(mtimes, default=0))
+
     def _prepare_current_title_info(self, results: Dict, time_info: str) -> Dict:
         """Build title info from current crawl results"""
-        title_info = {}
-        for source_id, titles_data in results.items():
-            title_info[source_id] = {}
-            for title, title_data in titles_data.items():
-                ranks = title_data.get("ranks", [])
-                url = title_data.get("url", "")
-                mobile_url = title_data.get("mobileUrl", "")
-
-                title_info[source_id][title] = {
+        return {
+            source_id: {
+                title: {
                     "first_time": time_info,
                     "last_time": time_info,
                     "count": 1,
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
+                    "ranks": title_data.get("ranks", []),
+                    "url": title_data.get("url", ""),
+                    "mobileUrl": title_data.get("mobileUrl", ""),
                 }
-        return title_info
+                for title, title_data in titles_data.items()
+            }
+            for source_id, titles_data in results.items()
+        }
 
     def _run_analysis_pipeline(
         self,
@@ -4997,13 +5274,11 @@ class NewsAnalyzer:
         html_file_path: Optional[str] = None,
     ) -> bool:
         """Unified notification sending logic with all condition checks"""
-        has_notification = self._has_notification_configured()
-
-        if (
-            CONFIG["ENABLE_NOTIFICATION"]
-            and has_notification
-            and self._has_valid_content(stats, new_titles)
-        ):
+        if not CONFIG["ENABLE_NOTIFICATION"]:
+            print(f"Skipping {report_type} notification: notifications disabled")
+        elif not self._has_notif:
+            print("⚠️ Warning: Notification enabled but no channels configured, skipping")
+        elif self._has_valid_content(stats, new_titles):
             send_to_notifications(
                 stats,
                 failed_ids or [],
@@ -5016,15 +5291,7 @@ class NewsAnalyzer:
                 html_file_path=html_file_path,
             )
             return True
-        elif CONFIG["ENABLE_NOTIFICATION"] and not has_notification:
-            print("⚠️ Warning: Notification enabled but no channels configured, skipping")
-        elif not CONFIG["ENABLE_NOTIFICATION"]:
-            print(f"Skipping {report_type} notification: notifications disabled")
-        elif (
-            CONFIG["ENABLE_NOTIFICATION"]
-            and has_notification
-            and not self._has_valid_content(stats, new_titles)
-        ):
+        else:
             mode_strategy = self._get_mode_strategy()
             if "realtime" in report_type.lower():
                 print(
@@ -5112,63 +5379,77 @@ class NewsAnalyzer:
     def _initialize_and_check_config(self) -> None:
         """General initialization and config check"""
         now = get_beijing_time()
-        print(f"Current Beijing time: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+        time_line = f"Current Beijing time: {now.strftime('%Y-%m-%d %H:%M:%S')}"
 
         if not CONFIG["ENABLE_CRAWLER"]:
-            print("Crawler disabled (ENABLE_CRAWLER=False), exiting")
+            print(f"{time_line}\nCrawler disabled (ENABLE_CRAWLER=False), exiting")
             return
 
-        has_notification = self._has_notification_configured()
         if not CONFIG["ENABLE_NOTIFICATION"]:
-            print("Notifications disabled (ENABLE_NOTIFICATION=False), crawling only")
-        elif not has_notification:
-            print("No notification channels configured, crawling only")
+            notification_line = "Notifications disabled (ENABLE_NOTIFICATION=False), crawling only"
+        elif not self._has_notif:
+            notification_line = "No notification channels configured, crawling only"
         else:
-            print("Notifications enabled, will send notifications")
+            notification_line = "Notifications enabled, will send notifications"
 
         mode_strategy = self._get_mode_strategy()
-        print(f"Report mode: {self.report_mode}")
-        print(f"Run mode: {mode_strategy['description']}")
+        # Status lines are written in one go
+        print(
+            "\n".join(
+                [
+                    time_line,
+                    notification_line,
+                    f"Report mode: {self.report_mode}",
+                    f"Run mode: {mode_strategy['description']}",
+                ]
+            )
+        )
 
-    def _crawl_data(self) -> Tuple[Dict, Dict, List]:
+    def _crawl_data(self) -> Tuple[Dict, Dict, List, str]:
         """Execute data crawling"""
-        ids = []
-        for platform in CONFIG["PLATFORMS"]:
-            if "name" in platform:
-                ids.append((platform["id"], platform["name"]))
-            else:
-                ids.append(platform["id"])
-
         print(
-            f"Configured platforms: {[p.get('name', p['id']) for p in CONFIG['PLATFORMS']]}"
+            f"Configured platforms: {self._platform_display_names}\n"
+            f"Starting crawl, request interval {self.request_interval} ms"
         )
-        print(f"Starting crawl, request interval {self.request_interval} ms")
         ensure_directory_exists("output")
 
         results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
-            ids, self.request_interval
+            self._platform_crawl_ids, self.request_interval
         )
 
         title_file = save_titles_to_file(results, id_to_name, failed_ids)
         print(f"Titles saved to: {title_file}")
 
-        return results, id_to_name, failed_ids
+        return results, id_to_name, failed_ids, title_file
 
     def _execute_mode_strategy(
-        self, mode_strategy: Dict, results: Dict, id_to_name: Dict, failed_ids: List
+        self,
+        mode_strategy: Dict,
+        results: Dict,
+        id_to_name: Dict,
+        failed_ids: List,
+        title_file: str,
     ) -> Optional[str]:
         """Execute mode-specific logic"""
         # Get current platform ID list
-        current_platform_ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
+        current_platform_ids = self._platform_ids
+
+        time_info = Path(title_file).stem
+
+        # These only read today's files and the word list, run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            new_titles_future = executor.submit(
+                detect_latest_new_titles, current_platform_ids
+            )
+            frequency_words_future = executor.submit(load_frequency_words)
 
-        new_titles = detect_latest_new_titles(current_platform_ids)
-        time_info = Path(save_titles_to_file(results, id_to_name, failed_ids)).stem
-        word_groups, filter_words = load_frequency_words()
+            new_titles = new_titles_future.result()
+            word_groups, filter_words = frequency_words_future.result()
 
         # In current mode, realtime push needs full historical data for statistics
         if self.report_mode == "current":
             # Load full historical data (filtered by current platforms)
-            analysis_data = self._load_analysis_data()
+            analysis_data = self._load_analysis_data(new_titles=new_titles)
             if analysis_data:
                 (
                     all_results,
@@ -5194,13 +5475,14 @@ class NewsAnalyzer:
                     failed_ids=failed_ids,
                 )
 
-                combined_id_to_name = {**historical_id_to_name, **id_to_name}
-
                 print(f"HTML report generated: {html_file}")
 
                 # Send realtime notification (using full historical data stats)
                 summary_html = None
                 if mode_strategy["should_send_realtime"]:
+                    # Current crawl names take precedence over historical ones,
+                    # only looked up, so chain the two instead of merging
+                    combined_id_to_name = ChainMap(id_to_name, historical_id_to_name)
                     self._send_notification_if_needed(
                         stats,
                         mode_strategy["realtime_report_type"],
@@ -5255,11 +5537,11 @@ class NewsAnalyzer:
         # Open browser (non-container environments only)
         if self._should_open_browser() and html_file:
             if summary_html:
-                summary_url = "file://" + str(Path(summary_html).resolve())
+                summary_url = file_uri(summary_html)
                 print(f"Opening summary report: {summary_url}")
                 webbrowser.open(summary_url)
             else:
-                file_url = "file://" + str(Path(html_file).resolve())
+                file_url = file_uri(html_file)
                 print(f"Opening HTML report: {file_url}")
                 webbrowser.open(file_url)
         elif self.is_docker_container and html_file:
@@ -5277,9 +5559,11 @@ class NewsAnalyzer:
 
             mode_strategy = self._get_mode_strategy()
 
-            results, id_to_name, failed_ids = self._crawl_data()
+            results, id_to_name, failed_ids, title_file = self._crawl_data()
 
-            self._execute_mode_strategy(mode_strategy, results, id_to_name, failed_ids)
+            self._execute_mode_strategy(
+                mode_strategy, results, id_to_name, failed_ids, title_file
+            )
 
         except Exception as e:
             print(f"Analysis workflow error: {e}")
@@ -5,41 +5,120 @@ Provides production-grade MCP tool server using FastMCP 2.0.
 Supports both stdio and HTTP transport modes.
 """
 
+import asyncio
 import json
-from typing import List, Optional, Dict
+import sys
+import threading
+from datetime import date
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import List, Optional, Dict, Tuple
 
 from fastmcp import FastMCP
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .tools.data_query import DataQueryTools
 from .tools.analytics import AnalyticsTools
 from .tools.search_tools import SearchTools
 from .tools.config_mgmt import ConfigManagementTools
 from .tools.system import SystemManagementTools
+from .services.cache_service import get_cache
 from .utils.date_parser import DateParser
 from .utils.errors import MCPError
 
 
 # Create FastMCP 2.0 application
+# Tools are registered with output_schema=None: they already return JSON
+# text, and FastMCP would otherwise repeat the whole string as
+# structuredContent {"result": ...} in every response
 mcp = FastMCP('trendradar-news')
 
-# Global tool instances (initialized on first request)
-_tools_instances = {}
+# Global tool instances, created by run_server at startup (or on first
+# request when the module is served some other way)
+_TOOLS: Optional[SimpleNamespace] = None
+_TOOLS_LOCK = threading.Lock()
+
+
+def _dump(result) -> str:
+    """Serialize a tool result as compact JSON (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # Types orjson rejects fall back to the stdlib encoder
+            pass
+    return json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+
+
+async def _cached_response(key: str, ttl: int, compute) -> str:
+    """
+    Get a serialized tool response from cache, computing it on a miss
+
+    Entries share the data layer's TTL and are keyed on today's date (for
+    "today" defaults) and today's data version, so a crawl saved by this
+    server or by main.py is served on the next call instead of after the
+    stacked TTLs. Failed results are not cached. Hits are served on the
+    event loop; misses run compute in a worker thread.
+    """
+    cache = get_cache()
+    version = _get_tools().data.data_service.parser.get_data_version()
+    cache_key = f"response:{version}:{date.today().isoformat()}:{key}"
+    cached = cache.get(cache_key, ttl=ttl)
+    if cached is not None:
+        return cached
+
+    result = await asyncio.to_thread(compute)
+    response = _dump(result)
+    if result.get("success"):
+        cache.set(cache_key, response, ttl=ttl)
+    return response
 
 
-def _get_tools(project_root: Optional[str] = None):
-    """Get or create tool instances (singleton pattern)"""
-    if not _tools_instances:
-        _tools_instances['data'] = DataQueryTools(project_root)
-        _tools_instances['analytics'] = AnalyticsTools(project_root)
-        _tools_instances['search'] = SearchTools(project_root)
-        _tools_instances['config'] = ConfigManagementTools(project_root)
-        _tools_instances['system'] = SystemManagementTools(project_root)
-    return _tools_instances
+@lru_cache(maxsize=64)
+def _norm_platforms_cached(platforms: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(sorted(set(platforms)))
+
+
+def _norm_platforms(platforms: Optional[List[str]]) -> Optional[Tuple[str, ...]]:
+    """
+    Normalize a platforms argument to a sorted, de-duplicated tuple
+
+    None and [] both mean "all configured platforms" and normalize to None,
+    so equivalent requests share one cached response.
+    """
+    if not platforms:
+        return None
+    return _norm_platforms_cached(tuple(platforms))
+
+
+def _init_tools(project_root: Optional[str] = None) -> SimpleNamespace:
+    """Create tool instances once (singleton pattern)"""
+    global _TOOLS
+    with _TOOLS_LOCK:
+        if _TOOLS is None:
+            _TOOLS = SimpleNamespace(
+                data=DataQueryTools(project_root),
+                analytics=AnalyticsTools(project_root),
+                search=SearchTools(project_root),
+                config=ConfigManagementTools(project_root),
+                system=SystemManagementTools(project_root),
+            )
+    return _TOOLS
+
+
+def _get_tools() -> SimpleNamespace:
+    """Get tool instances"""
+    return _TOOLS or _init_tools()
 
 
 # ==================== Date Parsing Tools (Recommended Priority) ====================
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def resolve_date_range(
     expression: str
 ) -> str:
@@ -91,27 +170,28 @@ async def resolve_date_range(
            -> {"date_range": {"start": "2025-11-20", "end": "2025-11-26"}, ...}
         2. search_news(query="Tesla", date_range={"start": "2025-11-20", "end": "2025-11-26"})
     """
+    # DateParser caches the resolved range per expression and day
     try:
         result = DateParser.resolve_date_range_expression(expression)
-        return json.dumps(result, ensure_ascii=False, indent=2)
     except MCPError as e:
-        return json.dumps({
+        result = {
             "success": False,
             "error": e.to_dict()
-        }, ensure_ascii=False, indent=2)
+        }
     except Exception as e:
-        return json.dumps({
+        result = {
             "success": False,
             "error": {
                 "code": "INTERNAL_ERROR",
                 "message": str(e)
             }
-        }, ensure_ascii=False, indent=2)
+        }
+    return _dump(result)
 
 
 # ==================== Data Query Tools ====================
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def get_latest_news(
     platforms: Optional[List[str]] = None,
     limit: int = 50,
@@ -144,12 +224,19 @@ async def get_latest_news(
 
     **Note**: If user asks "why only partial display", they need complete data
     """
-    tools = _get_tools()
-    result = tools['data'].get_latest_news(platforms=platforms, limit=limit, include_url=include_url)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    platforms = _norm_platforms(platforms)
+    return await _cached_response(
+        f"latest_news:{platforms!r}:{limit}:{include_url}",
+        900,
+        lambda: _get_tools().data.get_latest_news(
+            platforms=list(platforms) if platforms else None,
+            limit=limit,
+            include_url=include_url
+        )
+    )
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def get_trending_topics(
     top_n: int = 10,
     mode: str = 'current'
@@ -170,12 +257,14 @@ async def get_trending_topics(
     Returns:
         JSON formatted watchlist keyword frequency statistics
     """
-    tools = _get_tools()
-    result = tools['data'].get_trending_topics(top_n=top_n, mode=mode)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _cached_response(
+        f"trending_topics:{top_n}:{mode}",
+        1800,
+        lambda: _get_tools().data.get_trending_topics(top_n=top_n, mode=mode)
+    )
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def get_news_by_date(
     date_query: Optional[str] = None,
     platforms: Optional[List[str]] = None,
@@ -213,20 +302,23 @@ async def get_news_by_date(
 
     **Note**: If user asks "why only partial display", they need complete data
     """
-    tools = _get_tools()
-    result = tools['data'].get_news_by_date(
-        date_query=date_query,
-        platforms=platforms,
-        limit=limit,
-        include_url=include_url
+    platforms = _norm_platforms(platforms)
+    return await _cached_response(
+        f"news_by_date:{date_query!r}:{platforms!r}:{limit}:{include_url}",
+        1800,
+        lambda: _get_tools().data.get_news_by_date(
+            date_query=date_query,
+            platforms=list(platforms) if platforms else None,
+            limit=limit,
+            include_url=include_url
+        )
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 
 # ==================== Advanced Data Analytics Tools ====================
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def analyze_topic_trend(
     topic: str,
     analysis_type: str = "trend",
@@ -276,8 +368,8 @@ async def analyze_topic_trend(
         1. resolve_date_range("last 30 days") -> {"date_range": {"start": "2025-10-28", "end": "2025-11-26"}}
         2. analyze_topic_trend(topic="Tesla", analysis_type="lifecycle", date_range=...)
     """
-    tools = _get_tools()
-    result = tools['analytics'].analyze_topic_trend_unified(
+    result = await asyncio.to_thread(
+        _get_tools().analytics.analyze_topic_trend_unified,
         topic=topic,
         analysis_type=analysis_type,
         date_range=date_range,
@@ -287,10 +379,10 @@ async def analyze_topic_trend(
         lookahead_hours=lookahead_hours,
         confidence_threshold=confidence_threshold
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _dump(result)
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def analyze_data_insights(
     insight_type: str = "platform_compare",
     topic: Optional[str] = None,
@@ -322,18 +414,18 @@ async def analyze_data_insights(
         - analyze_data_insights(insight_type="platform_activity", date_range={"start": "2025-01-01", "end": "2025-01-07"})
         - analyze_data_insights(insight_type="keyword_cooccur", min_frequency=5, top_n=15)
     """
-    tools = _get_tools()
-    result = tools['analytics'].analyze_data_insights_unified(
+    result = await asyncio.to_thread(
+        _get_tools().analytics.analyze_data_insights_unified,
         insight_type=insight_type,
         topic=topic,
         date_range=date_range,
         min_frequency=min_frequency,
         top_n=top_n
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _dump(result)
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def analyze_sentiment(
     topic: Optional[str] = None,
     platforms: Optional[List[str]] = None,
@@ -385,8 +477,18 @@ async def analyze_sentiment(
     - **Default display method**: Show complete analysis results (including all news)
     - Only filter when user explicitly requests "summary" or "highlights"
     """
-    tools = _get_tools()
-    result = tools['analytics'].analyze_sentiment(
+    # The default call (today, all platforms, no topic) is the common one
+    # and is served from the response cache
+    if (topic is None and not platforms and date_range is None
+            and limit == 50 and sort_by_weight and not include_url):
+        return await _cached_response(
+            "sentiment:default",
+            900,
+            lambda: _get_tools().analytics.analyze_sentiment()
+        )
+
+    result = await asyncio.to_thread(
+        _get_tools().analytics.analyze_sentiment,
         topic=topic,
         platforms=platforms,
         date_range=date_range,
@@ -394,10 +496,10 @@ async def analyze_sentiment(
         sort_by_weight=sort_by_weight,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _dump(result)
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def find_similar_news(
     reference_title: str,
     threshold: float = 0.6,
@@ -423,17 +525,17 @@ async def find_similar_news(
     - **Default display method**: Show all returned news (including similarity scores)
     - Only filter when user explicitly requests "summary" or "highlights"
     """
-    tools = _get_tools()
-    result = tools['analytics'].find_similar_news(
+    result = await asyncio.to_thread(
+        _get_tools().analytics.find_similar_news,
         reference_title=reference_title,
         threshold=threshold,
         limit=limit,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _dump(result)
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def generate_summary_report(
     report_type: str = "daily",
     date_range: Optional[Dict[str, str]] = None
@@ -451,17 +553,17 @@ async def generate_summary_report(
     Returns:
         JSON formatted summary report, including Markdown format content
     """
-    tools = _get_tools()
-    result = tools['analytics'].generate_summary_report(
+    result = await asyncio.to_thread(
+        _get_tools().analytics.generate_summary_report,
         report_type=report_type,
         date_range=date_range
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _dump(result)
 
 
 # ==================== Smart Search Tools ====================
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def search_news(
     query: str,
     search_mode: str = "keyword",
@@ -526,8 +628,8 @@ async def search_news(
     - **Default display method**: Show all returned news, no summarization or filtering needed
     - Only filter when user explicitly requests "summary" or "highlights"
     """
-    tools = _get_tools()
-    result = tools['search'].search_news_unified(
+    result = await asyncio.to_thread(
+        _get_tools().search.search_news_unified,
         query=query,
         search_mode=search_mode,
         date_range=date_range,
@@ -537,10 +639,10 @@ async def search_news(
         threshold=threshold,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _dump(result)
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def search_related_news_history(
     reference_text: str,
     time_preset: str = "yesterday",
@@ -573,20 +675,20 @@ async def search_related_news_history(
     - **Default display method**: Show all returned news (including relevance scores)
     - Only filter when user explicitly requests "summary" or "highlights"
     """
-    tools = _get_tools()
-    result = tools['search'].search_related_news_history(
+    result = await asyncio.to_thread(
+        _get_tools().search.search_related_news_history,
         reference_text=reference_text,
         time_preset=time_preset,
         threshold=threshold,
         limit=limit,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _dump(result)
 
 
 # ==================== Configuration & System Management Tools ====================
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def get_current_config(
     section: str = "all"
 ) -> str:
@@ -604,12 +706,14 @@ async def get_current_config(
     Returns:
         JSON formatted configuration information
     """
-    tools = _get_tools()
-    result = tools['config'].get_current_config(section=section)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    # Cached by DataService, keyed on the config file mtimes
+    result = await asyncio.to_thread(
+        _get_tools().config.get_current_config, section=section
+    )
+    return _dump(result)
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def get_system_status() -> str:
     """
     Get system running status and health check information
@@ -619,12 +723,23 @@ async def get_system_status() -> str:
     Returns:
         JSON formatted system status information
     """
-    tools = _get_tools()
-    result = tools['system'].get_system_status()
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await asyncio.to_thread(_get_tools().system.get_system_status)
+    return _dump(result)
+
+
+def _warm_default_responses() -> None:
+    """
+    Pre-render the no-argument responses of the cached query tools
+
+    Run in a background thread after trigger_crawl saves new data, so the
+    most common calls are served from cache for the new data version.
+    """
+    for tool in (get_latest_news, get_trending_topics, get_news_by_date,
+                 analyze_sentiment):
+        asyncio.run(tool.fn())
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def trigger_crawl(
     platforms: Optional[List[str]] = None,
     save_to_local: bool = False,
@@ -654,13 +769,56 @@ async def trigger_crawl(
         - Crawl and save: trigger_crawl(platforms=['weibo'], save_to_local=True)
         - Use default platforms: trigger_crawl()  # Crawl all platforms configured in config.yaml
     """
-    tools = _get_tools()
-    result = tools['system'].trigger_crawl(platforms=platforms, save_to_local=save_to_local, include_url=include_url)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await asyncio.to_thread(
+        _get_tools().system.trigger_crawl,
+        platforms=platforms,
+        save_to_local=save_to_local,
+        include_url=include_url
+    )
+    if save_to_local and result.get("success"):
+        threading.Thread(target=_warm_default_responses, daemon=True).start()
+    return _dump(result)
 
 
 # ==================== Entry Point ====================
 
+# Startup banner printed by run_server
+_BANNER_TEMPLATE = """
+============================================================
+  TrendRadar MCP Server - FastMCP 2.0
+============================================================
+  Transport mode: {transport}
+{protocol}  Project directory: {project_dir}
+
+  Registered tools:
+    === Date Parsing Tools (Recommended Priority) ===
+    0. resolve_date_range       - Parse natural language dates to standard format
+
+    === Basic Data Query (P0 Core) ===
+    1. get_latest_news        - Get latest news
+    2. get_news_by_date       - Query news by date (supports natural language)
+    3. get_trending_topics    - Get trending topics
+
+    === Smart Search Tools ===
+    4. search_news                  - Unified news search (keyword/fuzzy/entity)
+    5. search_related_news_history  - Historical related news search
+
+    === Advanced Data Analytics ===
+    6. analyze_topic_trend      - Unified topic trend analysis (popularity/lifecycle/viral/predict)
+    7. analyze_data_insights    - Unified data insight analysis (platform compare/activity/keyword co-occurrence)
+    8. analyze_sentiment        - Sentiment analysis
+    9. find_similar_news        - Find similar news
+    10. generate_summary_report - Daily/weekly summary generation
+
+    === Configuration & System Management ===
+    11. get_current_config      - Get current system configuration
+    12. get_system_status       - Get system running status
+    13. trigger_crawl           - Manually trigger crawl task
+============================================================
+
+"""
+
+
 def run_server(
     project_root: Optional[str] = None,
     transport: str = 'stdio',
@@ -677,54 +835,28 @@ def run_server(
         port: Listen port for HTTP mode, default 3333
     """
     # Initialize tool instances
-    _get_tools(project_root)
-
-    # Print startup information
-    print()
-    print("=" * 60)
-    print("  TrendRadar MCP Server - FastMCP 2.0")
-    print("=" * 60)
-    print(f"  Transport mode: {transport.upper()}")
+    _init_tools(project_root)
 
+    # Print startup information in a single write
     if transport == 'stdio':
-        print("  Protocol: MCP over stdio (standard input/output)")
-        print("  Description: Communicates with MCP client via standard I/O")
+        protocol = (
+            "  Protocol: MCP over stdio (standard input/output)\n"
+            "  Description: Communicates with MCP client via standard I/O\n"
+        )
     elif transport == 'http':
-        print(f"  Protocol: MCP over HTTP (production environment)")
-        print(f"  Server listening: {host}:{port}")
-
-    if project_root:
-        print(f"  Project directory: {project_root}")
+        protocol = (
+            "  Protocol: MCP over HTTP (production environment)\n"
+            f"  Server listening: {host}:{port}\n"
+        )
     else:
-        print("  Project directory: Current directory")
-
-    print()
-    print("  Registered tools:")
-    print("    === Date Parsing Tools (Recommended Priority) ===")
-    print("    0. resolve_date_range       - Parse natural language dates to standard format")
-    print()
-    print("    === Basic Data Query (P0 Core) ===")
-    print("    1. get_latest_news        - Get latest news")
-    print("    2. get_news_by_date       - Query news by date (supports natural language)")
-    print("    3. get_trending_topics    - Get trending topics")
-    print()
-    print("    === Smart Search Tools ===")
-    print("    4. search_news                  - Unified news search (keyword/fuzzy/entity)")
-    print("    5. search_related_news_history  - Historical related news search")
-    print()
-    print("    === Advanced Data Analytics ===")
-    print("    6. analyze_topic_trend      - Unified topic trend analysis (popularity/lifecycle/viral/predict)")
-    print("    7. analyze_data_insights    - Unified data insight analysis (platform compare/activity/keyword co-occurrence)")
-    print("    8. analyze_sentiment        - Sentiment analysis")
-    print("    9. find_similar_news        - Find similar news")
-    print("    10. generate_summary_report - Daily/weekly summary generation")
-    print()
-    print("    === Configuration & System Management ===")
-    print("    11. get_current_config      - Get current system configuration")
-    print("    12. get_system_status       - Get system running status")
-    print("    13. trigger_crawl           - Manually trigger crawl task")
-    print("=" * 60)
-    print()
+        protocol = ""
+
+    sys.stdout.write(_BANNER_TEMPLATE.format(
+        transport=transport.upper(),
+        protocol=protocol,
+        project_dir=project_root or "Current directory"
+    ))
+    sys.stdout.flush()
 
     # Run server based on transport mode
     if transport == 'stdio':
@@ -2,57 +2,216 @@
 Cache Service
 
 Implements TTL-based caching mechanism to improve data access performance.
+Entry ages use the monotonic clock, so system clock changes never expire
+or extend entries.
+
+Set TRENDRADAR_CACHE_DB to a file path to also keep entries in SQLite, so
+they survive server restarts. Only JSON values (str, numbers, bools, None,
+lists and str-keyed dicts) are written there, others stay memory-only.
 """
 
+import json
+import os
+import sqlite3
+import sys
 import time
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
 from threading import Lock
 
 
+# Sentinel for "not in cache", so cached None/empty values still count as hits
+_MISS = object()
+
+# Size of the access frequency sketch (power of two)
+_FREQUENCY_SLOTS = 4096
+_FREQUENCY_MASK = _FREQUENCY_SLOTS - 1
+
+# Persisted entries older than this are dropped when the database is opened
+# (longer than any TTL used by the services)
+_PERSIST_MAX_AGE = 24 * 3600
+
+
+def _is_json_value(value: Any) -> bool:
+    """Whether value survives a JSON round trip unchanged"""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if isinstance(value, list):
+        return all(_is_json_value(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _is_json_value(item)
+            for key, item in value.items()
+        )
+    return False
+
+
 class CacheService:
     """Cache service class"""
 
-    def __init__(self):
-        """Initialize cache service"""
-        self._cache = {}
-        self._timestamps = {}
+    def __init__(self, maxsize: int = 512, persistent_path: Optional[str] = None):
+        """
+        Initialize cache service
+
+        Args:
+            maxsize: Maximum number of entries; the least recently used
+                entry is evicted when a new key would exceed it
+            persistent_path: Optional SQLite file that mirrors cache entries,
+                so they are still available after a restart
+        """
+        # key -> (timestamp, value, ttl), least recently used first
+        self._store = OrderedDict()
+        self._maxsize = maxsize
         self._lock = Lock()
 
-    def get(self, key: str, ttl: int = 900) -> Optional[Any]:
+        # Per-key locks held while a missing value is being computed
+        self._compute_locks = {}
+
+        # Approximate access frequency per key hash (TinyLFU-style admission).
+        # When the cache is full, a new key only replaces the LRU victim if it
+        # has been requested more often, so one-off queries cannot push out
+        # recurring ones. Counts are halved periodically so old hits fade.
+        self._frequency = bytearray(_FREQUENCY_SLOTS)
+        self._frequency_ops = 0
+        self._frequency_reset_at = maxsize * 10
+
+        # Largest TTL requested so far, the expiry assumed for entries
+        # stored without a TTL of their own
+        self._max_ttl = 0
+
+        # The database is only used outside self._lock, under its own lock,
+        # so memory hits never wait for disk I/O
+        self._db_lock = Lock()
+        self._db = self._open_db(persistent_path) if persistent_path else None
+
+    def get(self, key: Hashable, ttl: int = 900, default: Any = None) -> Optional[Any]:
         """
         Get cached data
 
         Args:
             key: Cache key
             ttl: Time to live in seconds, default 15 minutes
+            default: Returned when the key does not exist or has expired; pass
+                a sentinel to tell a miss apart from a cached None
 
         Returns:
-            Cached value, or None if not exists or expired
+            Cached value, or default if not exists or expired
         """
+        now = time.monotonic()
         with self._lock:
-            if key in self._cache:
+            self._record_access(key)
+            if ttl > self._max_ttl:
+                self._max_ttl = ttl
+            entry = self._store.get(key)
+            if entry is not None:
                 # Check if expired
-                if time.time() - self._timestamps[key] < ttl:
-                    return self._cache[key]
-                else:
-                    # Expired, delete cache
-                    del self._cache[key]
-                    del self._timestamps[key]
-        return None
+                if now - entry[0] < ttl:
+                    self._store.move_to_end(key)
+                    return entry[1]
+                # Expired, delete cache
+                del self._store[key]
+
+        if self._db is None:
+            return default
+
+        # Outside the lock, so other keys' hits never wait for disk I/O
+        entry = self._load_persisted(key, ttl, now)
+        if entry is None:
+            return default
+        with self._lock:
+            self._insert(key, entry, now)
+        return entry[1]
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None) -> None:
         """
         Set cached data
 
         Args:
             key: Cache key
-            value: Value to cache
+            value: Value to cache (not stored if the cache is full and the
+                key is used less often than the entry it would evict)
+            ttl: TTL the entry will be read with, lets it be evicted as soon
+                as it expires; defaults to the largest TTL requested so far
         """
+        now = time.monotonic()
+        entry = (now, value, ttl)
         with self._lock:
-            self._cache[key] = value
-            self._timestamps[key] = time.time()
+            stored = self._insert(key, entry, now)
+        if stored and self._db is not None:
+            self._persist(key, entry)
 
-    def delete(self, key: str) -> bool:
+    def _insert(self, key: Hashable, entry: tuple, now: float) -> bool:
+        """Store an entry, evicting if full (lock held); returns whether stored"""
+        if key in self._store:
+            self._store.move_to_end(key)
+        elif len(self._store) >= self._maxsize:
+            # Evict least recently used entry, unless it is still live and
+            # more frequently used than the new key
+            victim = next(iter(self._store))
+            if (not self._is_expired(self._store[victim], now)
+                    and self._frequency_of(key) <= self._frequency_of(victim)):
+                return False
+            del self._store[victim]
+        self._store[key] = entry
+        return True
+
+    def _is_expired(self, entry: tuple, now: float) -> bool:
+        """Whether an entry is past its TTL (lock held)"""
+        timestamp, _, ttl = entry
+        return now - timestamp >= (ttl if ttl is not None else self._max_ttl)
+
+    def get_or_compute(self, key: Hashable, ttl: int, producer: Callable[[], Any]) -> Any:
+        """
+        Get cached data, computing and caching it on a miss
+
+        Concurrent misses on the same key wait for a single producer call
+        instead of each computing the value.
+
+        Args:
+            key: Cache key
+            ttl: Time to live in seconds
+            producer: Callable building the value; exceptions propagate and
+                nothing is cached
+
+        Returns:
+            Cached or newly computed value
+        """
+        value = self.get(key, ttl=ttl, default=_MISS)
+        if value is not _MISS:
+            return value
+
+        with self._lock:
+            compute_lock = self._compute_locks.setdefault(key, Lock())
+
+        try:
+            with compute_lock:
+                # Another thread may have filled the entry while we waited
+                value = self.get(key, ttl=ttl, default=_MISS)
+                if value is _MISS:
+                    value = producer()
+                    self.set(key, value, ttl=ttl)
+                return value
+        finally:
+            with self._lock:
+                if self._compute_locks.get(key) is compute_lock:
+                    del self._compute_locks[key]
+
+    def _record_access(self, key: Hashable) -> None:
+        """Count one access to key in the frequency sketch (lock held)"""
+        slot = hash(key) & _FREQUENCY_MASK
+        if self._frequency[slot] < 255:
+            self._frequency[slot] += 1
+
+        self._frequency_ops += 1
+        if self._frequency_ops >= self._frequency_reset_at:
+            self._frequency = bytearray(count >> 1 for count in self._frequency)
+            self._frequency_ops = 0
+
+    def _frequency_of(self, key: Hashable) -> int:
+        """Get the approximate access count of key (lock held)"""
+        return self._frequency[hash(key) & _FREQUENCY_MASK]
+
+    def delete(self, key: Hashable) -> bool:
         """
         Delete cache entry
 
@@ -63,17 +222,104 @@ class CacheService:
             Whether deletion was successful
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                del self._timestamps[key]
-                return True
-        return False
+            deleted = self._store.pop(key, None) is not None
+        if self._db is not None:
+            self._delete_persisted(key)
+        return deleted
 
     def clear(self) -> None:
         """Clear all cache"""
         with self._lock:
-            self._cache.clear()
-            self._timestamps.clear()
+            self._store.clear()
+        if self._db is not None:
+            self._execute("DELETE FROM cache")
+
+    @staticmethod
+    def _open_db(path: str) -> Optional[sqlite3.Connection]:
+        """Open the persistence database and drop entries too old to be used"""
+        try:
+            db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, saved_at REAL, value BLOB)"
+            )
+            db.execute(
+                "DELETE FROM cache WHERE saved_at < ?",
+                (time.time() - _PERSIST_MAX_AGE,)
+            )
+        except sqlite3.Error as e:
+            # Run memory-only rather than fail every cache user
+            print(f"Warning: Cache database {path} unavailable: {e}", file=sys.stderr)
+            return None
+        return db
+
+    def _execute(self, sql: str, params: tuple = ()) -> Optional[list]:
+        """
+        Run a statement on the persistence database (self._lock not held)
+
+        Returns:
+            Fetched rows, or None if the database failed (locked, disk full,
+            ...); the cache then behaves as if the entry were not persisted
+        """
+        try:
+            with self._db_lock:
+                return self._db.execute(sql, params).fetchall()
+        except sqlite3.Error:
+            return None
+
+    def _persist(self, key: Hashable, entry: tuple) -> None:
+        """Write an entry to the persistence database"""
+        value = entry[1]
+        if not _is_json_value(value):
+            # Values JSON cannot represent exactly stay memory-only
+            return
+        text = json.dumps(value, ensure_ascii=False)
+        try:
+            with self._db_lock:
+                # Skip the write if the entry was replaced or deleted meanwhile,
+                # their own database writes are queued behind this one
+                with self._lock:
+                    if self._store.get(key) is not entry:
+                        return
+                self._db.execute(
+                    "INSERT OR REPLACE INTO cache (key, saved_at, value) VALUES (?, ?, ?)",
+                    (repr(key), time.time(), text)
+                )
+        except sqlite3.Error:
+            pass
+
+    def _delete_persisted(self, key: Hashable) -> None:
+        """Remove an entry from the persistence database"""
+        self._execute("DELETE FROM cache WHERE key = ?", (repr(key),))
+
+    def _load_persisted(self, key: Hashable, ttl: int, now: float) -> Optional[tuple]:
+        """
+        Load a live entry from the persistence database
+
+        The wall-clock age of the saved row is mapped onto the monotonic
+        clock, so the entry expires when it would have in the old process.
+        Expired or unreadable rows are deleted.
+        """
+        rows = self._execute(
+            "SELECT saved_at, value FROM cache WHERE key = ?", (repr(key),)
+        )
+        if not rows:
+            return None
+
+        saved_at, text = rows[0]
+        age = max(0.0, time.time() - saved_at)
+        if age >= ttl:
+            self._delete_persisted(key)
+            return None
+        try:
+            value = json.loads(text)
+        except (TypeError, ValueError):
+            # Unreadable, e.g. a row written by an older format
+            self._delete_persisted(key)
+            return None
+
+        return (now - age, value, ttl)
 
     def cleanup_expired(self, ttl: int = 900) -> int:
         """
@@ -85,16 +331,15 @@ class CacheService:
         Returns:
             Number of entries cleaned up
         """
+        current_time = time.monotonic()
         with self._lock:
-            current_time = time.time()
             expired_keys = [
-                key for key, timestamp in self._timestamps.items()
-                if current_time - timestamp >= ttl
+                key for key, entry in self._store.items()
+                if current_time - entry[0] >= ttl
             ]
 
             for key in expired_keys:
-                del self._cache[key]
-                del self._timestamps[key]
+                del self._store[key]
 
             return len(expired_keys)
 
@@ -105,18 +350,16 @@ class CacheService:
         Returns:
             Statistics dictionary
         """
+        # Only the snapshot needs the lock; min/max run after releasing it
         with self._lock:
-            return {
-                "total_entries": len(self._cache),
-                "oldest_entry_age": (
-                    time.time() - min(self._timestamps.values())
-                    if self._timestamps else 0
-                ),
-                "newest_entry_age": (
-                    time.time() - max(self._timestamps.values())
-                    if self._timestamps else 0
-                )
-            }
+            timestamps = [entry[0] for entry in self._store.values()]
+
+        now = time.monotonic()
+        return {
+            "total_entries": len(timestamps),
+            "oldest_entry_age": now - min(timestamps) if timestamps else 0,
+            "newest_entry_age": now - max(timestamps) if timestamps else 0
+        }
 
 
 # Global cache instance
@@ -132,5 +375,7 @@ def get_cache() -> CacheService:
     """
     global _global_cache
     if _global_cache is None:
-        _global_cache = CacheService()
+        _global_cache = CacheService(
+            persistent_path=os.environ.get("TRENDRADAR_CACHE_DB") or None
+        )
     return _global_cache
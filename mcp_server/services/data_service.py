@@ -4,16 +4,113 @@ Data Access Service
 Provides unified data query interface, encapsulating data access logic.
 """
 
+import heapq
+import os
 import re
 from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 from .cache_service import get_cache
 from .parser_service import ParserService
 from ..utils.errors import DataNotFoundError
 
 
+# Sort key for the rows yielded by _rank_rows
+_row_rank = itemgetter(0)
+
+# get_trending_topics mode descriptions
+_MODE_DESCRIPTIONS = {
+    "daily": "Daily cumulative statistics",
+    "current": "Latest batch statistics"
+}
+
+# Date folder names under output/ (format: YYYY年MM月DD日)
+_DATE_FOLDER_RE = re.compile(r'(\d{4})年(\d{2})月(\d{2})日')
+
+# Joins titles for a single substring scan; never part of a news title
+_TITLE_SEPARATOR = "\x1f"
+
+
+def _titles_containing(titles: Dict[str, Dict], keyword_lower: str) -> List[str]:
+    """
+    Get titles whose lowercase form contains keyword_lower, in dict order
+
+    Joins the titles once and scans them with str.find instead of
+    lowercasing and testing each title separately. Caseless keywords (CJK,
+    digits) can only match unchanged characters, so the titles are not
+    lowercased at all for them.
+    """
+    if len(titles) <= 8 or _TITLE_SEPARATOR in keyword_lower:
+        return [title for title in titles if keyword_lower in title.lower()]
+
+    text = _TITLE_SEPARATOR.join(titles)
+    # Every character produced by str.lower() changes under str.upper(),
+    # except the combining dot above from "İ"
+    if keyword_lower != keyword_lower.upper() or "\u0307" in keyword_lower:
+        text = text.lower()
+    if text.count(_TITLE_SEPARATOR) != len(titles) - 1:
+        # A title contains the separator itself
+        return [title for title in titles if keyword_lower in title.lower()]
+
+    title_list = list(titles)
+    matches = []
+    index = 0  # title that starts at offset `start`
+    start = 0
+    while True:
+        pos = text.find(keyword_lower, start)
+        if pos < 0:
+            break
+        index += text.count(_TITLE_SEPARATOR, start, pos)
+        matches.append(title_list[index])
+
+        # Resume at the next title, one match per title is enough
+        end = text.find(_TITLE_SEPARATOR, pos)
+        if end < 0:
+            break
+        start = end + 1
+        index += 1
+    return matches
+
+
+def _dir_size(path: str) -> int:
+    """Get the total size of the regular files under a directory"""
+    total = 0
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+def _rank_rows(all_titles: Dict[str, Dict]) -> Iterator[Tuple[int, str, str, Dict]]:
+    """
+    Yield (first rank, platform_id, title, info) for every title
+
+    Lets callers pick the top ranked titles before building a news
+    dict for each of them.
+    """
+    for platform_id, titles in all_titles.items():
+        for title, info in titles.items():
+            yield (info["ranks"][0] if info["ranks"] else 0, platform_id, title, info)
+
+
+def _platforms_key(platforms: Optional[List[str]]) -> Tuple[str, ...]:
+    """Order-independent cache key part for a platform list"""
+    return tuple(sorted(platforms)) if platforms else ()
+
+
 class DataService:
     """Data access service class"""
 
@@ -27,6 +124,13 @@ class DataService:
         self.parser = ParserService(project_root)
         self.cache = get_cache()
 
+        # (watch words, Aho-Corasick automaton) for get_trending_topics
+        self._keyword_matcher = None
+        # (watch words, {title: indexes of matched words}) from the last count
+        self._title_matches = None
+        # ((output dir, mtime_ns), scan result) from _scan_output_dir
+        self._output_scan = None
+
     def get_latest_news(
         self,
         platforms: Optional[List[str]] = None,
@@ -47,12 +151,24 @@ class DataService:
         Raises:
             DataNotFoundError: Data not found
         """
-        # Try to get from cache
-        cache_key = f"latest_news:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=900)  # 15 minute cache
-        if cached:
-            return cached
+        # Keyed on today's data version, so a new crawl is read at once
+        cache_key = (
+            "latest_news", _platforms_key(platforms), limit, include_url,
+            self.parser.get_data_version()
+        )
+        return self.cache.get_or_compute(
+            cache_key,
+            900,  # 15 minute cache
+            lambda: self._load_latest_news(platforms, limit, include_url)
+        )
 
+    def _load_latest_news(
+        self,
+        platforms: Optional[List[str]],
+        limit: int,
+        include_url: bool
+    ) -> List[Dict]:
+        """Build the latest news list (uncached, see get_latest_news)"""
         # Read today's data
         all_titles, id_to_name, timestamps = self.parser.read_all_titles_for_date(
             date=None,
@@ -66,38 +182,27 @@ class DataService:
         else:
             fetch_time = datetime.now()
 
-        # Convert to news list
-        news_list = []
-        for platform_id, titles in all_titles.items():
-            platform_name = id_to_name.get(platform_id, platform_id)
-
-            for title, info in titles.items():
-                # Take first rank
-                rank = info["ranks"][0] if info["ranks"] else 0
+        # Take the top ranked titles (first rank), no need to sort the rest
+        top_rows = heapq.nsmallest(limit, _rank_rows(all_titles), key=_row_rank)
+        timestamp = fetch_time.strftime("%Y-%m-%d %H:%M:%S")
 
-                news_item = {
-                    "title": title,
-                    "platform": platform_id,
-                    "platform_name": platform_name,
-                    "rank": rank,
-                    "timestamp": fetch_time.strftime("%Y-%m-%d %H:%M:%S")
-                }
-
-                # Conditionally add URL fields
-                if include_url:
-                    news_item["url"] = info.get("url", "")
-                    news_item["mobileUrl"] = info.get("mobileUrl", "")
-
-                news_list.append(news_item)
-
-        # Sort by rank
-        news_list.sort(key=lambda x: x["rank"])
+        # Convert to news list
+        result = []
+        for rank, platform_id, title, info in top_rows:
+            news_item = {
+                "title": title,
+                "platform": platform_id,
+                "platform_name": id_to_name.get(platform_id, platform_id),
+                "rank": rank,
+                "timestamp": timestamp
+            }
 
-        # Limit return count
-        result = news_list[:limit]
+            # Conditionally add URL fields
+            if include_url:
+                news_item["url"] = info.get("url", "")
+                news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-        # Cache result
-        self.cache.set(cache_key, result)
+            result.append(news_item)
 
         return result
 
@@ -131,12 +236,27 @@ class DataService:
             ...     limit=20
             ... )
         """
-        # Try to get from cache
+        # Today's data is keyed on its version, so a new crawl is read at once
+        is_today = target_date.date() == datetime.now().date()
+        cache_key = (
+            "news_by_date", target_date.date(), _platforms_key(platforms), limit, include_url,
+            self.parser.get_data_version(target_date) if is_today else 0
+        )
+        return self.cache.get_or_compute(
+            cache_key,
+            1800,  # 30 minute cache
+            lambda: self._load_news_by_date(target_date, platforms, limit, include_url)
+        )
+
+    def _load_news_by_date(
+        self,
+        target_date: datetime,
+        platforms: Optional[List[str]],
+        limit: int,
+        include_url: bool
+    ) -> List[Dict]:
+        """Build the news list for a date (uncached, see get_news_by_date)"""
         date_str = target_date.strftime("%Y-%m-%d")
-        cache_key = f"news_by_date:{date_str}:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30 minute cache
-        if cached:
-            return cached
 
         # Read data for specified date
         all_titles, id_to_name, timestamps = self.parser.read_all_titles_for_date(
@@ -144,40 +264,31 @@ class DataService:
             platform_ids=platforms
         )
 
-        # Convert to news list
-        news_list = []
-        for platform_id, titles in all_titles.items():
-            platform_name = id_to_name.get(platform_id, platform_id)
-
-            for title, info in titles.items():
-                # Calculate average rank
-                avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
-
-                news_item = {
-                    "title": title,
-                    "platform": platform_id,
-                    "platform_name": platform_name,
-                    "rank": info["ranks"][0] if info["ranks"] else 0,
-                    "avg_rank": round(avg_rank, 2),
-                    "count": len(info["ranks"]),
-                    "date": date_str
-                }
-
-                # Conditionally add URL fields
-                if include_url:
-                    news_item["url"] = info.get("url", "")
-                    news_item["mobileUrl"] = info.get("mobileUrl", "")
+        # Take the top ranked titles (first rank), no need to sort the rest
+        top_rows = heapq.nsmallest(limit, _rank_rows(all_titles), key=_row_rank)
 
-                news_list.append(news_item)
-
-        # Sort by rank
-        news_list.sort(key=lambda x: x["rank"])
+        # Convert to news list
+        result = []
+        for rank, platform_id, title, info in top_rows:
+            # Calculate average rank
+            avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
+
+            news_item = {
+                "title": title,
+                "platform": platform_id,
+                "platform_name": id_to_name.get(platform_id, platform_id),
+                "rank": rank,
+                "avg_rank": round(avg_rank, 2),
+                "count": len(info["ranks"]),
+                "date": date_str
+            }
 
-        # Limit return count
-        result = news_list[:limit]
+            # Conditionally add URL fields
+            if include_url:
+                news_item["url"] = info.get("url", "")
+                news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-        # Cache result (historical data cached longer)
-        self.cache.set(cache_key, result)
+            result.append(news_item)
 
         return result
 
@@ -210,9 +321,14 @@ class DataService:
             # Default search today
             start_date = end_date = datetime.now()
 
-        # Collect all matching news
+        # Collect matching news, only the first `limit` are kept as dicts
         results = []
+        max_results = limit if limit is not None and limit > 0 else None
         platform_distribution = Counter()
+        rank_sum = 0
+        rank_count = 0
+
+        keyword_lower = keyword.lower()
 
         # Iterate through date range
         current_date = start_date
@@ -222,29 +338,37 @@ class DataService:
                     date=current_date,
                     platform_ids=platforms
                 )
+                date_str = current_date.strftime("%Y-%m-%d")
 
                 # Search titles containing keyword
                 for platform_id, titles in all_titles.items():
                     platform_name = id_to_name.get(platform_id, platform_id)
 
-                    for title, info in titles.items():
-                        if keyword.lower() in title.lower():
-                            # Calculate average rank
-                            avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
-
-                            results.append({
-                                "title": title,
-                                "platform": platform_id,
-                                "platform_name": platform_name,
-                                "ranks": info["ranks"],
-                                "count": len(info["ranks"]),
-                                "avg_rank": round(avg_rank, 2),
-                                "url": info.get("url", ""),
-                                "mobileUrl": info.get("mobileUrl", ""),
-                                "date": current_date.strftime("%Y-%m-%d")
-                            })
-
-                            platform_distribution[platform_id] += 1
+                    for title in _titles_containing(titles, keyword_lower):
+                        info = titles[title]
+
+                        # Statistics cover every match
+                        platform_distribution[platform_id] += 1
+                        rank_sum += sum(info["ranks"])
+                        rank_count += len(info["ranks"])
+
+                        if max_results is not None and len(results) >= max_results:
+                            continue
+
+                        # Calculate average rank
+                        avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
+
+                        results.append({
+                            "title": title,
+                            "platform": platform_id,
+                            "platform_name": platform_name,
+                            "ranks": info["ranks"],
+                            "count": len(info["ranks"]),
+                            "avg_rank": round(avg_rank, 2),
+                            "url": info.get("url", ""),
+                            "mobileUrl": info.get("mobileUrl", ""),
+                            "date": date_str
+                        })
 
             except DataNotFoundError:
                 # No data for this date, continue to next day
@@ -260,16 +384,8 @@ class DataService:
             )
 
         # Calculate statistics
-        total_ranks = []
-        for item in results:
-            total_ranks.extend(item["ranks"])
-
-        avg_rank = sum(total_ranks) / len(total_ranks) if total_ranks else 0
-
-        # Limit return count (if specified)
-        total_found = len(results)
-        if limit is not None and limit > 0:
-            results = results[:limit]
+        avg_rank = rank_sum / rank_count if rank_count else 0
+        total_found = sum(platform_distribution.values())
 
         return {
             "results": results,
@@ -303,12 +419,15 @@ class DataService:
         Raises:
             DataNotFoundError: Data not found
         """
-        # Try to get from cache
-        cache_key = f"trending_topics:{top_n}:{mode}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30 minute cache
-        if cached:
-            return cached
+        # Keyed on today's data version, so a new crawl is read at once
+        return self.cache.get_or_compute(
+            ("trending_topics", top_n, mode, self.parser.get_data_version()),
+            1800,  # 30 minute cache
+            lambda: self._load_trending_topics(top_n, mode)
+        )
 
+    def _load_trending_topics(self, top_n: int, mode: str) -> Dict:
+        """Build keyword frequency statistics (uncached, see get_trending_topics)"""
         # Read today's data
         all_titles, id_to_name, timestamps = self.parser.read_all_titles_for_date()
 
@@ -355,20 +474,9 @@ class DataService:
         word_frequency = Counter()
         keyword_to_news = {}
 
-        # Iterate through titles to process
-        for platform_id, titles in titles_to_process.items():
-            for title in titles.keys():
-                # Match against each keyword group
-                for group in word_groups:
-                    all_words = group.get("required", []) + group.get("normal", [])
-
-                    for word in all_words:
-                        if word and word in title:
-                            word_frequency[word] += 1
-
-                            if word not in keyword_to_news:
-                                keyword_to_news[word] = []
-                            keyword_to_news[word].append(title)
+        self._count_keywords(
+            titles_to_process, word_groups, word_frequency, keyword_to_news
+        )
 
         # Get TOP N keywords
         top_keywords = word_frequency.most_common(top_n)
@@ -392,21 +500,89 @@ class DataService:
             "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "mode": mode,
             "total_keywords": len(word_frequency),
-            "description": self._get_mode_description(mode)
+            "description": _MODE_DESCRIPTIONS.get(mode, "Unknown mode")
         }
 
-        # Cache result
-        self.cache.set(cache_key, result)
-
         return result
 
-    def _get_mode_description(self, mode: str) -> str:
-        """Get mode description"""
-        descriptions = {
-            "daily": "Daily cumulative statistics",
-            "current": "Latest batch statistics"
-        }
-        return descriptions.get(mode, "Unknown mode")
+    def _count_keywords(
+        self,
+        titles_to_process: Dict,
+        word_groups: List[Dict],
+        word_frequency: Counter,
+        keyword_to_news: Dict
+    ) -> None:
+        """
+        Count watch word matches in titles
+
+        Produces the same counts as checking every word of every group
+        against each title: a word listed n times across groups counts n
+        times per matching title, and words are first counted in list order.
+
+        The words matched by each title are remembered between calls, so a
+        recount only scans titles that are new since the previous one.
+        """
+        # Word -> number of times it is listed, in first-listed order
+        word_multiplicity = Counter(
+            word
+            for group in word_groups
+            for word in group.get("required", []) + group.get("normal", [])
+            if word
+        )
+        if not word_multiplicity:
+            return
+
+        words = tuple(word_multiplicity)
+        previous = self._title_matches
+        known = previous[1] if previous is not None and previous[0] == words else {}
+        matches = {}
+
+        if AHOCORASICK_AVAILABLE:
+            if self._keyword_matcher is None or self._keyword_matcher[0] != words:
+                automaton = ahocorasick.Automaton()
+                for index, word in enumerate(words):
+                    automaton.add_word(word, index)
+                automaton.make_automaton()
+                self._keyword_matcher = (words, automaton)
+            automaton = self._keyword_matcher[1]
+
+        for titles in titles_to_process.values():
+            for title in titles:
+                indexes = matches.get(title)
+                if indexes is None:
+                    indexes = known.get(title)
+                    if indexes is None:
+                        if AHOCORASICK_AVAILABLE:
+                            indexes = tuple(sorted({index for _, index in automaton.iter(title)}))
+                        else:
+                            indexes = tuple(
+                                index for index, word in enumerate(words) if word in title
+                            )
+                    matches[title] = indexes
+
+                for index in indexes:
+                    word = words[index]
+                    word_frequency[word] += word_multiplicity[word]
+                    keyword_to_news.setdefault(word, []).append(title)
+
+        # Keep only the titles seen this time, so old days drop out
+        self._title_matches = (words, matches)
+
+    def get_config_signature(self) -> Tuple[int, int]:
+        """
+        Get modification times of the config files
+
+        Returns:
+            (config.yaml mtime_ns, frequency_words.txt mtime_ns), 0 for a missing file
+        """
+        config_dir = self.parser.project_root / "config"
+        signature = []
+        for name in ("config.yaml", "frequency_words.txt"):
+            try:
+                signature.append((config_dir / name).stat().st_mtime_ns)
+            except OSError:
+                signature.append(0)
+        return tuple(signature)
 
     def get_current_config(self, section: str = "all") -> Dict:
         """
@@ -421,12 +597,15 @@ class DataService:
         Raises:
             FileParseError: Config file parsing error
         """
-        # Try to get from cache
-        cache_key = f"config:{section}"
-        cached = self.cache.get(cache_key, ttl=3600)  # 1 hour cache
-        if cached:
-            return cached
+        # Keyed on file mtimes, so edits apply at once
+        return self.cache.get_or_compute(
+            ("config", section, self.get_config_signature()),
+            3600,  # 1 hour cache
+            lambda: self._load_current_config(section)
+        )
 
+    def _load_current_config(self, section: str) -> Dict:
+        """Build the configuration summary (uncached, see get_current_config)"""
         # Parse config file
         config_data = self.parser.parse_yaml_config()
         word_groups = self.parser.parse_frequency_words()
@@ -490,9 +669,6 @@ class DataService:
         else:
             result = {}
 
-        # Cache result
-        self.cache.set(cache_key, result)
-
         return result
 
     def get_available_date_range(self) -> Tuple[Optional[datetime], Optional[datetime]]:
@@ -507,33 +683,54 @@ class DataService:
             >>> earliest, latest = service.get_available_date_range()
             >>> print(f"Available date range: {earliest} to {latest}")
         """
-        output_dir = self.parser.project_root / "output"
+        scan = self._scan_output_dir()
+        return (scan["oldest"], scan["latest"])
+
+    def _scan_output_dir(self) -> Dict:
+        """
+        Scan the output directory for its folders and their dates
 
-        if not output_dir.exists():
-            return (None, None)
+        Reused until the output directory's mtime changes, which happens
+        whenever a folder is added or removed.
 
-        available_dates = []
+        Returns:
+            {folders: [folder paths], dates: [sorted folder dates], oldest, latest}
+        """
+        output_dir = self.parser.project_root / "output"
+        try:
+            mtime_ns = output_dir.stat().st_mtime_ns
+        except OSError:
+            return {"folders": [], "dates": [], "oldest": None, "latest": None}
+
+        scan = self._output_scan
+        if scan is not None and scan[0] == (output_dir, mtime_ns):
+            return scan[1]
+
+        folders = []
+        dates = []
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                folders.append(entry.path)
 
-        # Iterate through date folders
-        for date_folder in output_dir.iterdir():
-            if date_folder.is_dir() and not date_folder.name.startswith('.'):
                 # Parse date (format: YYYY年MM月DD日)
-                try:
-                    date_match = re.match(r'(\d{4})年(\d{2})月(\d{2})日', date_folder.name)
-                    if date_match:
-                        folder_date = datetime(
-                            int(date_match.group(1)),
-                            int(date_match.group(2)),
-                            int(date_match.group(3))
-                        )
-                        available_dates.append(folder_date)
-                except Exception:
-                    pass
-
-        if not available_dates:
-            return (None, None)
-
-        return (min(available_dates), max(available_dates))
+                date_match = _DATE_FOLDER_RE.match(entry.name)
+                if date_match:
+                    try:
+                        dates.append(datetime(*map(int, date_match.groups())))
+                    except ValueError:
+                        pass
+
+        dates.sort()
+        result = {
+            "folders": folders,
+            "dates": dates,
+            "oldest": dates[0] if dates else None,
+            "latest": dates[-1] if dates else None
+        }
+        self._output_scan = ((output_dir, mtime_ns), result)
+        return result
 
     def get_system_status(self) -> Dict:
         """
@@ -543,41 +740,14 @@ class DataService:
             System status dictionary
         """
         # Get data statistics
-        output_dir = self.parser.project_root / "output"
+        scan = self._scan_output_dir()
+        oldest_record = scan["oldest"]
+        latest_record = scan["latest"]
 
+        # Calculate storage size, files change without touching the folder list
         total_storage = 0
-        oldest_record = None
-        latest_record = None
-        total_news = 0
-
-        if output_dir.exists():
-            # Iterate through date folders
-            for date_folder in output_dir.iterdir():
-                if date_folder.is_dir():
-                    # Parse date
-                    try:
-                        date_str = date_folder.name
-                        # Format: YYYY年MM月DD日
-                        date_match = re.match(r'(\d{4})年(\d{2})月(\d{2})日', date_str)
-                        if date_match:
-                            folder_date = datetime(
-                                int(date_match.group(1)),
-                                int(date_match.group(2)),
-                                int(date_match.group(3))
-                            )
-
-                            if oldest_record is None or folder_date < oldest_record:
-                                oldest_record = folder_date
-                            if latest_record is None or folder_date > latest_record:
-                                latest_record = folder_date
-
-                    except:
-                        pass
-
-                    # Calculate storage size
-                    for item in date_folder.rglob("*"):
-                        if item.is_file():
-                            total_storage += item.stat().st_size
+        for date_folder in scan["folders"]:
+            total_storage += _dir_size(date_folder)
 
         # Read version info
         version_file = self.parser.project_root / "version"
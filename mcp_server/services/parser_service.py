@@ -4,15 +4,27 @@ File Parser Service
 Provides parsing functionality for txt format news data and YAML configuration files.
 """
 
-import re
+import os
+import sys
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 
 import yaml
 
+# libyaml's C loader when PyYAML was built with it, same results as SafeLoader
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 from ..utils.errors import FileParseError, DataNotFoundError
-from .cache_service import get_cache
+from .cache_service import CacheService
+
+
+# Parsed days are large, so they get their own small LRU shared by all
+# parser instances instead of taking slots in the shared response cache
+_titles_cache = CacheService(maxsize=64)
 
 
 class ParserService:
@@ -33,7 +45,10 @@ class ParserService:
             self.project_root = Path(project_root)
 
         # Initialize cache service
-        self.cache = get_cache()
+        self.cache = _titles_cache
+
+        # Parsed config files: {path: (mtime_ns, parsed result)}
+        self._config_files: Dict[Path, Tuple[int, Any]] = {}
 
     @staticmethod
     def clean_title(title: str) -> str:
@@ -46,18 +61,20 @@ class ParserService:
         Returns:
             Cleaned title
         """
-        # Remove extra whitespace
-        title = re.sub(r'\s+', ' ', title)
-        # Remove special characters
-        title = title.strip()
-        return title
+        # Collapse whitespace runs and trim both ends
+        return ' '.join(title.split())
 
-    def parse_txt_file(self, file_path: Path) -> Tuple[Dict, Dict]:
+    def parse_txt_file(
+        self,
+        file_path: Path,
+        platform_ids: Optional[Set[str]] = None
+    ) -> Tuple[Dict, Dict]:
         """
         Parse title data from a single txt file
 
         Args:
             file_path: Path to txt file
+            platform_ids: Platform IDs to parse, None means all platforms
 
         Returns:
             (titles_by_id, id_to_name) tuple
@@ -75,74 +92,99 @@ class ParserService:
 
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                sections = content.split("\n\n")
-
-                for section in sections:
-                    if not section.strip() or "==== 以下ID请求失败 ====" in section:
-                        continue
-
-                    lines = section.strip().split("\n")
-                    if len(lines) < 2:
-                        continue
-
-                    # Parse header: id | name or id
-                    header_line = lines[0].strip()
-                    if " | " in header_line:
-                        parts = header_line.split(" | ", 1)
-                        source_id = parts[0].strip()
-                        name = parts[1].strip()
-                        id_to_name[source_id] = name
+                # Sections are separated by empty lines
+                section = []
+                for line in f:
+                    if line == "\n":
+                        self._parse_section(section, titles_by_id, id_to_name, platform_ids)
+                        section = []
                     else:
-                        source_id = header_line
-                        id_to_name[source_id] = source_id
-
-                    titles_by_id[source_id] = {}
-
-                    # Parse title lines
-                    for line in lines[1:]:
-                        if line.strip():
-                            try:
-                                title_part = line.strip()
-                                rank = None
-
-                                # Extract rank
-                                if ". " in title_part and title_part.split(". ")[0].isdigit():
-                                    rank_str, title_part = title_part.split(". ", 1)
-                                    rank = int(rank_str)
-
-                                # Extract MOBILE URL
-                                mobile_url = ""
-                                if " [MOBILE:" in title_part:
-                                    title_part, mobile_part = title_part.rsplit(" [MOBILE:", 1)
-                                    if mobile_part.endswith("]"):
-                                        mobile_url = mobile_part[:-1]
-
-                                # Extract URL
-                                url = ""
-                                if " [URL:" in title_part:
-                                    title_part, url_part = title_part.rsplit(" [URL:", 1)
-                                    if url_part.endswith("]"):
-                                        url = url_part[:-1]
-
-                                title = self.clean_title(title_part.strip())
-                                ranks = [rank] if rank is not None else [1]
-
-                                titles_by_id[source_id][title] = {
-                                    "ranks": ranks,
-                                    "url": url,
-                                    "mobileUrl": mobile_url,
-                                }
-
-                            except Exception as e:
-                                # Ignore single line parsing errors
-                                continue
+                        section.append(line)
+                self._parse_section(section, titles_by_id, id_to_name, platform_ids)
 
         except Exception as e:
             raise FileParseError(str(file_path), str(e))
 
         return titles_by_id, id_to_name
 
+    def _parse_section(
+        self,
+        section: List[str],
+        titles_by_id: Dict,
+        id_to_name: Dict,
+        platform_ids: Optional[Set[str]] = None
+    ) -> None:
+        """
+        Parse one section of a txt file into titles_by_id and id_to_name
+
+        Args:
+            section: Lines of the section, a platform header followed by title lines
+            titles_by_id: {platform_id: {title: {ranks, url, mobileUrl}}} to fill
+            id_to_name: {platform_id: platform_name} to fill
+            platform_ids: Platform IDs to parse, other sections are skipped
+        """
+        # Lines read from a file are never empty, isspace() spots the blank ones
+        lines = [line for line in section if not line.isspace()]
+        if len(lines) < 2 or any("==== 以下ID请求失败 ====" in line for line in lines):
+            return
+
+        # Parse header: id | name or id
+        # Interned, every file and cached news item repeats them
+        source_id, separator, name = lines[0].strip().partition(" | ")
+        source_id = sys.intern(source_id.strip())
+        name = sys.intern(name.strip()) if separator else source_id
+
+        # Skip title lines of platforms that were not asked for
+        if platform_ids is not None and source_id not in platform_ids:
+            return
+
+        id_to_name[source_id] = name
+
+        titles_by_id[source_id] = {}
+
+        # Parse title lines
+        for line in lines[1:]:
+            try:
+                title_part = line.strip()
+                rank = None
+
+                # Extract rank: leading digits followed by ". "
+                digits = 0
+                while digits < len(title_part) and title_part[digits].isdigit():
+                    digits += 1
+                if digits and title_part.startswith(". ", digits):
+                    rank = int(title_part[:digits])
+                    title_part = title_part[digits + 2:]
+
+                # Extract MOBILE URL
+                mobile_url = ""
+                head, marker, mobile_part = title_part.rpartition(" [MOBILE:")
+                if marker:
+                    title_part = head
+                    if mobile_part.endswith("]"):
+                        mobile_url = mobile_part[:-1]
+
+                # Extract URL
+                url = ""
+                head, marker, url_part = title_part.rpartition(" [URL:")
+                if marker:
+                    title_part = head
+                    if url_part.endswith("]"):
+                        url = url_part[:-1]
+
+                title = self.clean_title(title_part.strip())
+                ranks = [rank] if rank is not None else [1]
+
+                titles_by_id[source_id][title] = {
+                    "ranks": ranks,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+
+            except Exception as e:
+                # Ignore single line parsing errors
+                continue
+
     def get_date_folder_name(self, date: datetime = None) -> str:
         """
         Get date folder name
@@ -155,7 +197,30 @@ class ParserService:
         """
         if date is None:
             date = datetime.now()
-        return date.strftime("%Y年%m月%d日")
+        return f"{date.year}年{date.month:02d}月{date.day:02d}日"
+
+    def get_data_version(self, date: datetime = None) -> int:
+        """
+        Get a token that changes whenever the txt files of a date change
+
+        Args:
+            date: Date object, defaults to today
+
+        Returns:
+            Newest mtime_ns of the txt directory and its txt files, 0 if there is none
+        """
+        txt_dir = self.project_root / "output" / self.get_date_folder_name(date) / "txt"
+        try:
+            # The directory mtime covers added and removed files,
+            # the file mtimes cover a file rewritten in place
+            version = os.stat(txt_dir).st_mtime_ns
+            with os.scandir(txt_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".txt"):
+                        version = max(version, entry.stat().st_mtime_ns)
+        except OSError:
+            return 0
+        return version
 
     def read_all_titles_for_date(
         self,
@@ -178,23 +243,27 @@ class ParserService:
         Raises:
             DataNotFoundError: Data not found
         """
+        # Read the clock once for both the folder name and the TTL choice
+        now = datetime.now()
+
         # Generate cache key
-        date_str = self.get_date_folder_name(date)
-        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
-        cache_key = f"read_all_titles:{date_str}:{platform_key}"
+        date_folder = self.get_date_folder_name(date or now)
+        platform_key = tuple(sorted(platform_ids)) if platform_ids else ()
 
         # Try to get from cache
         # For historical data (not today), use longer cache time (1 hour)
-        # For today's data, use shorter cache time (15 minutes) as new data may arrive
-        is_today = (date is None) or (date.date() == datetime.now().date())
+        # For today's data, use shorter cache time (15 minutes) as new data may arrive,
+        # and key it on the data version so a new crawl is read at once
+        is_today = (date is None) or (date.date() == now.date())
         ttl = 900 if is_today else 3600  # 15 minutes vs 1 hour
+        version = self.get_data_version(now) if is_today else 0
+        cache_key = ("read_all_titles", date_folder, platform_key, version)
 
         cached = self.cache.get(cache_key, ttl=ttl)
         if cached:
             return cached
 
         # Cache miss, read files
-        date_folder = self.get_date_folder_name(date)
         txt_dir = self.project_root / "output" / date_folder / "txt"
 
         if not txt_dir.exists():
@@ -206,9 +275,15 @@ class ParserService:
         all_titles = {}
         id_to_name = {}
         all_timestamps = {}
+        platform_filter = set(platform_ids) if platform_ids else None
 
-        # Read all txt files
-        txt_files = sorted(txt_dir.glob("*.txt"))
+        # Read all txt files, the directory entries carry their stat results
+        with os.scandir(txt_dir) as entries:
+            txt_files = [
+                entry for entry in entries
+                if entry.name.endswith(".txt") and entry.is_file()
+            ]
+        txt_files.sort(key=lambda entry: entry.name)
 
         if not txt_files:
             raise DataNotFoundError(
@@ -218,33 +293,35 @@ class ParserService:
 
         for txt_file in txt_files:
             try:
-                titles_by_id, file_id_to_name = self.parse_txt_file(txt_file)
+                titles_by_id, file_id_to_name = self.parse_txt_file(
+                    Path(txt_file.path), platform_filter
+                )
 
                 # Update id_to_name
                 id_to_name.update(file_id_to_name)
 
                 # Merge title data
                 for platform_id, titles in titles_by_id.items():
-                    # If platform filter is specified
-                    if platform_ids and platform_id not in platform_ids:
+                    merged = all_titles.get(platform_id)
+                    if merged is None:
+                        # First file with this platform, take its titles as they are
+                        all_titles[platform_id] = titles
                         continue
 
-                    if platform_id not in all_titles:
-                        all_titles[platform_id] = {}
-
                     for title, info in titles.items():
-                        if title in all_titles[platform_id]:
+                        existing = merged.get(title)
+                        if existing is not None:
                             # Merge ranks
-                            all_titles[platform_id][title]["ranks"].extend(info["ranks"])
+                            existing["ranks"].extend(info["ranks"])
                         else:
-                            all_titles[platform_id][title] = info.copy()
+                            merged[title] = info
 
                 # Record file timestamp
                 all_timestamps[txt_file.name] = txt_file.stat().st_mtime
 
             except Exception as e:
                 # Ignore single file parsing errors, continue processing other files
-                print(f"Warning: Failed to parse file {txt_file}: {e}")
+                print(f"Warning: Failed to parse file {txt_file.path}: {e}")
                 continue
 
         if not all_titles:
@@ -255,7 +332,7 @@ class ParserService:
 
         # Cache result
         result = (all_titles, id_to_name, all_timestamps)
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=ttl)
 
         return result
 
@@ -280,13 +357,21 @@ class ParserService:
         if not config_path.exists():
             raise FileParseError(str(config_path), "Config file does not exist")
 
+        # Reuse the last parse until the file is modified
+        mtime_ns = config_path.stat().st_mtime_ns
+        cached = self._config_files.get(config_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         try:
             with open(config_path, "r", encoding="utf-8") as f:
-                config_data = yaml.safe_load(f)
-            return config_data
+                config_data = yaml.load(f, Loader=YamlLoader)
         except Exception as e:
             raise FileParseError(str(config_path), str(e))
 
+        self._config_files[config_path] = (mtime_ns, config_data)
+        return config_data
+
     def parse_frequency_words(self, words_file: str = None) -> List[Dict]:
         """
         Parse keyword configuration file
@@ -308,6 +393,12 @@ class ParserService:
         if not words_file.exists():
             return []
 
+        # Reuse the last parse until the file is modified
+        mtime_ns = words_file.stat().st_mtime_ns
+        cached = self._config_files.get(words_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         word_groups = []
 
         try:
@@ -322,11 +413,9 @@ class ParserService:
                     if not parts:
                         continue
 
-                    group = {
-                        "required": [],
-                        "normal": [],
-                        "filter_words": []
-                    }
+                    required = []
+                    normal = []
+                    filter_words = []
 
                     for part in parts:
                         if not part:
@@ -336,20 +425,26 @@ class ParserService:
                         for word in words:
                             if not word:
                                 continue
-                            if word.endswith("+"):
+                            suffix = word[-1]
+                            if suffix == "+":
                                 # Required word
-                                group["required"].append(word[:-1])
-                            elif word.endswith("!"):
+                                required.append(word[:-1])
+                            elif suffix == "!":
                                 # Filter word
-                                group["filter_words"].append(word[:-1])
+                                filter_words.append(word[:-1])
                             else:
                                 # Normal word
-                                group["normal"].append(word)
+                                normal.append(word)
 
-                    if group["required"] or group["normal"]:
-                        word_groups.append(group)
+                    if required or normal:
+                        word_groups.append({
+                            "required": required,
+                            "normal": normal,
+                            "filter_words": filter_words
+                        })
 
         except Exception as e:
             raise FileParseError(str(words_file), str(e))
 
+        self._config_files[words_file] = (mtime_ns, word_groups)
         return word_groups
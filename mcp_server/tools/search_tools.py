@@ -8,6 +8,7 @@ import re
 from collections import Counter
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
+from functools import partial
 from typing import Dict, List, Optional, Tuple
 
 from ..services.data_service import DataService
@@ -120,6 +121,13 @@ class SearchTools:
                 # 使用最新可用日期
                 start_date = end_date = latest
 
+            # 根据搜索模式选择搜索方法（循环外只选择一次）
+            search_method = {
+                "keyword": self._search_by_keyword_mode,
+                "fuzzy": partial(self._search_by_fuzzy_mode, threshold=threshold),
+                "entity": self._search_by_entity_mode,
+            }[search_mode]
+
             # 收集所有匹配的新闻
             all_matches = []
             current_date = start_date
@@ -131,19 +139,9 @@ class SearchTools:
                         platform_ids=platforms
                     )
 
-                    # 根据搜索模式执行不同的搜索逻辑
-                    if search_mode == "keyword":
-                        matches = self._search_by_keyword_mode(
-                            query, all_titles, id_to_name, current_date, include_url
-                        )
-                    elif search_mode == "fuzzy":
-                        matches = self._search_by_fuzzy_mode(
-                            query, all_titles, id_to_name, current_date, threshold, include_url
-                        )
-                    else:  # entity
-                        matches = self._search_by_entity_mode(
-                            query, all_titles, id_to_name, current_date, include_url
-                        )
+                    matches = search_method(
+                        query, all_titles, id_to_name, current_date, include_url=include_url
+                    )
 
                     all_matches.extend(matches)
 
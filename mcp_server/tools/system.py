@@ -4,6 +4,7 @@
 实现系统状态查询和爬虫触发功能。
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -87,10 +88,8 @@ class SystemManagementTools:
             >>> print(result['saved_files'])
         """
         try:
-            import json
             import time
             import random
-            import requests
             from datetime import datetime
             import pytz
             import yaml
@@ -142,84 +141,38 @@ class SystemManagementTools:
 
             print(f"开始临时爬取，平台: {[p.get('name', p['id']) for p in target_platforms]}")
 
-            # 爬取数据
+            # 爬取数据：请求仍按间隔依次发出，响应等待和失败重试在线程池中并行
             results = {}
             id_to_name = {}
             failed_ids = []
+            futures = []
+
+            with ThreadPoolExecutor(max_workers=min(len(ids), 8)) as executor:
+                for i, id_info in enumerate(ids):
+                    if isinstance(id_info, tuple):
+                        id_value, name = id_info
+                    else:
+                        id_value = id_info
+                        name = id_value
+
+                    id_to_name[id_value] = name
+                    futures.append(
+                        (id_value, executor.submit(self._fetch_platform, id_value))
+                    )
 
-            for i, id_info in enumerate(ids):
-                if isinstance(id_info, tuple):
-                    id_value, name = id_info
-                else:
-                    id_value = id_info
-                    name = id_value
-
-                id_to_name[id_value] = name
-
-                # 构建请求URL
-                url = f"https://newsnow.busiyi.world/api/s?id={id_value}&latest"
-
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Accept": "application/json, text/plain, */*",
-                    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-                    "Connection": "keep-alive",
-                    "Cache-Control": "no-cache",
-                }
-
-                # 重试机制
-                max_retries = 2
-                retries = 0
-                success = False
-
-                while retries <= max_retries and not success:
-                    try:
-                        response = requests.get(url, headers=headers, timeout=10)
-                        response.raise_for_status()
-
-                        data_text = response.text
-                        data_json = json.loads(data_text)
-
-                        status = data_json.get("status", "未知")
-                        if status not in ["success", "cache"]:
-                            raise ValueError(f"响应状态异常: {status}")
-
-                        status_info = "最新数据" if status == "success" else "缓存数据"
-                        print(f"获取 {id_value} 成功（{status_info}）")
-
-                        # 解析数据
-                        results[id_value] = {}
-                        for index, item in enumerate(data_json.get("items", []), 1):
-                            title = item["title"]
-                            url_link = item.get("url", "")
-                            mobile_url = item.get("mobileUrl", "")
-
-                            if title in results[id_value]:
-                                results[id_value][title]["ranks"].append(index)
-                            else:
-                                results[id_value][title] = {
-                                    "ranks": [index],
-                                    "url": url_link,
-                                    "mobileUrl": mobile_url,
-                                }
-
-                        success = True
-
-                    except Exception as e:
-                        retries += 1
-                        if retries <= max_retries:
-                            wait_time = random.uniform(3, 5)
-                            print(f"请求 {id_value} 失败: {e}. {wait_time:.2f}秒后重试...")
-                            time.sleep(wait_time)
-                        else:
-                            print(f"请求 {id_value} 失败: {e}")
-                            failed_ids.append(id_value)
+                    # 请求间隔
+                    if i < len(ids) - 1:
+                        actual_interval = request_interval + random.randint(-10, 20)
+                        actual_interval = max(50, actual_interval)
+                        time.sleep(actual_interval / 1000)
 
-                # 请求间隔
-                if i < len(ids) - 1:
-                    actual_interval = request_interval + random.randint(-10, 20)
-                    actual_interval = max(50, actual_interval)
-                    time.sleep(actual_interval / 1000)
+                # 按平台配置顺序收集结果
+                for id_value, future in futures:
+                    titles = future.result()
+                    if titles is None:
+                        failed_ids.append(id_value)
+                    else:
+                        results[id_value] = titles
 
             # 格式化返回数据
             news_data = []
@@ -374,6 +327,83 @@ class SystemManagementTools:
                 }
             }
 
+    def _fetch_platform(self, id_value: str) -> Optional[Dict]:
+        """
+        爬取单个平台（带重试）
+
+        每次调用使用独立的 requests 会话（Session 非线程安全），重试复用其连接
+
+        Args:
+            id_value: 平台ID
+
+        Returns:
+            标题字典 {title: {"ranks", "url", "mobileUrl"}}，失败返回 None
+        """
+        import json
+        import time
+        import random
+        import requests
+
+        # 构建请求URL
+        url = f"https://newsnow.busiyi.world/api/s?id={id_value}&latest"
+
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            "Accept": "application/json, text/plain, */*",
+            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+            "Connection": "keep-alive",
+            "Cache-Control": "no-cache",
+        }
+
+        with requests.Session() as session:
+            # 重试机制
+            max_retries = 2
+            retries = 0
+
+            while retries <= max_retries:
+                try:
+                    response = session.get(url, headers=headers, timeout=10)
+                    response.raise_for_status()
+
+                    data_text = response.text
+                    data_json = json.loads(data_text)
+
+                    status = data_json.get("status", "未知")
+                    if status not in ["success", "cache"]:
+                        raise ValueError(f"响应状态异常: {status}")
+
+                    status_info = "最新数据" if status == "success" else "缓存数据"
+                    print(f"获取 {id_value} 成功（{status_info}）")
+
+                    # 解析数据
+                    titles = {}
+                    for index, item in enumerate(data_json.get("items", []), 1):
+                        title = item["title"]
+                        url_link = item.get("url", "")
+                        mobile_url = item.get("mobileUrl", "")
+
+                        if title in titles:
+                            titles[title]["ranks"].append(index)
+                        else:
+                            titles[title] = {
+                                "ranks": [index],
+                                "url": url_link,
+                                "mobileUrl": mobile_url,
+                            }
+
+                    return titles
+
+                except Exception as e:
+                    retries += 1
+                    if retries <= max_retries:
+                        wait_time = random.uniform(3, 5)
+                        print(f"请求 {id_value} 失败: {e}. {wait_time:.2f}秒后重试...")
+                        time.sleep(wait_time)
+                    else:
+                        print(f"请求 {id_value} 失败: {e}")
+
+            return None
+
     def _generate_simple_html(self, results: Dict, id_to_name: Dict, failed_ids: List, now) -> str:
         """生成简化的 HTML 报告"""
         html = """<!DOCTYPE html>
@@ -4,8 +4,10 @@ Date Parser Tool
 Supports multiple natural language date format parsing, including relative and absolute dates.
 """
 
+import calendar
 import re
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Tuple, Dict, Optional
 
 from .errors import InvalidParameterError
@@ -28,6 +30,9 @@ class DateParser:
         "yesterday": 1,
     }
 
+    # Both mappings in one table (for parse_date_query)
+    RELATIVE_DATE_MAPPING = {**CN_DATE_MAPPING, **EN_DATE_MAPPING}
+
     # Date range expressions (for resolve_date_range_expression)
     RANGE_EXPRESSIONS = {
         # Chinese expressions
@@ -77,6 +82,32 @@ class DateParser:
         "past month": "last_30_days",
     }
 
+    # Dynamic "最近N天" / "last N days" pattern (for resolve_date_range_expression)
+    LAST_N_DAYS_PATTERN = re.compile(
+        r'最近(?P<cn_days>\d+)天|(?:last|past)\s+(?P<en_days>\d+)\s+days?'
+    )
+
+    # Normalized "last_N_days" type (for _calculate_date_range)
+    LAST_N_DAYS_NORMALIZED_PATTERN = re.compile(r'last_(\d+)_days')
+
+    # Date query formats (for parse_date_query), one alternative per format
+    # in the order they are tried; the outer group names the matched format
+    DATE_QUERY_PATTERN = re.compile(
+        # N天前 / N days ago
+        r'(?P<days_ago>(?P<days>\d+)\s*(?:天前|days?\s+ago))'
+        # 上周一 / 本周三
+        r'|(?P<cn_weekday>(?P<cn_week>上|本)周(?P<cn_weekday_name>[一二三四五六日天]))'
+        # last monday / this friday
+        r'|(?P<en_weekday>(?P<en_week>last|this)\s+'
+        r'(?P<en_weekday_name>monday|tuesday|wednesday|thursday|friday|saturday|sunday))'
+        # YYYY-MM-DD
+        r'|(?P<iso_date>(?P<iso_date_year>\d{4})-(?P<iso_date_month>\d{1,2})-(?P<iso_date_day>\d{1,2}))'
+        # MM月DD日 / YYYY年MM月DD日
+        r'|(?P<cn_date>(?:(?P<cn_date_year>\d{4})年)?(?P<cn_date_month>\d{1,2})月(?P<cn_date_day>\d{1,2})日)'
+        # MM/DD / YYYY/MM/DD
+        r'|(?P<slash_date>(?:(?P<slash_date_year>\d{4})/)?(?P<slash_date_month>\d{1,2})/(?P<slash_date_day>\d{1,2}))'
+    )
+
     # Weekday mapping
     WEEKDAY_CN = {
         "一": 0, "二": 1, "三": 2, "四": 3,
@@ -89,7 +120,7 @@ class DateParser:
     }
 
     @staticmethod
-    def parse_date_query(date_query: str) -> datetime:
+    def parse_date_query(date_query: str, now: Optional[datetime] = None) -> datetime:
         """
         Parse date query string
 
@@ -102,6 +133,7 @@ class DateParser:
 
         Args:
             date_query: Date query string
+            now: Current time, defaults to datetime.now()
 
         Returns:
             datetime object
@@ -125,107 +157,61 @@ class DateParser:
                 suggestion="Please provide a valid date query, e.g.: today, yesterday, 2025-10-10"
             )
 
-        date_query = date_query.strip().lower()
-
-        # 1. Try to parse common Chinese relative dates
-        if date_query in DateParser.CN_DATE_MAPPING:
-            days_ago = DateParser.CN_DATE_MAPPING[date_query]
-            return datetime.now() - timedelta(days=days_ago)
-
-        # 2. Try to parse common English relative dates
-        if date_query in DateParser.EN_DATE_MAPPING:
-            days_ago = DateParser.EN_DATE_MAPPING[date_query]
-            return datetime.now() - timedelta(days=days_ago)
-
-        # 3. Try to parse "N天前" or "N days ago"
-        cn_days_ago_match = re.match(r'(\d+)\s*天前', date_query)
-        if cn_days_ago_match:
-            days = int(cn_days_ago_match.group(1))
+        if now is None:
+            now = datetime.now()
+
+        # 1-2. Try to parse common Chinese and English relative dates,
+        # as given first since they usually arrive already normalized
+        days_ago = DateParser.RELATIVE_DATE_MAPPING.get(date_query)
+        if days_ago is None:
+            date_query = date_query.strip().lower()
+            days_ago = DateParser.RELATIVE_DATE_MAPPING.get(date_query)
+        if days_ago is not None:
+            return now - timedelta(days=days_ago)
+
+        # 3-8. Match every remaining format in one pass
+        match = DateParser.DATE_QUERY_PATTERN.match(date_query)
+        kind = match.lastgroup if match else None
+
+        # 3. "N天前" or "N days ago"
+        if kind == "days_ago":
+            days = int(match.group("days"))
             if days > 365:
                 raise InvalidParameterError(
                     f"Days too large: {days} days",
                     suggestion="Please use relative dates less than 365 days or use absolute dates"
                 )
-            return datetime.now() - timedelta(days=days)
+            return now - timedelta(days=days)
 
-        en_days_ago_match = re.match(r'(\d+)\s*days?\s+ago', date_query)
-        if en_days_ago_match:
-            days = int(en_days_ago_match.group(1))
-            if days > 365:
-                raise InvalidParameterError(
-                    f"Days too large: {days} days",
-                    suggestion="Please use relative dates less than 365 days or use absolute dates"
-                )
-            return datetime.now() - timedelta(days=days)
-
-        # 4. Try to parse Chinese weekday: 上周一, 本周三
-        cn_weekday_match = re.match(r'(上|本)周([一二三四五六日天])', date_query)
-        if cn_weekday_match:
-            week_type = cn_weekday_match.group(1)  # 上 or 本
-            weekday_str = cn_weekday_match.group(2)
-            target_weekday = DateParser.WEEKDAY_CN[weekday_str]
-            return DateParser._get_date_by_weekday(target_weekday, week_type == "上")
-
-        # 5. Try to parse English weekday: last monday, this friday
-        en_weekday_match = re.match(r'(last|this)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)', date_query)
-        if en_weekday_match:
-            week_type = en_weekday_match.group(1)  # last or this
-            weekday_str = en_weekday_match.group(2)
-            target_weekday = DateParser.WEEKDAY_EN[weekday_str]
-            return DateParser._get_date_by_weekday(target_weekday, week_type == "last")
-
-        # 6. Try to parse absolute date: YYYY-MM-DD
-        iso_date_match = re.match(r'(\d{4})-(\d{1,2})-(\d{1,2})', date_query)
-        if iso_date_match:
-            year = int(iso_date_match.group(1))
-            month = int(iso_date_match.group(2))
-            day = int(iso_date_match.group(3))
-            try:
-                return datetime(year, month, day)
-            except ValueError as e:
-                raise InvalidParameterError(
-                    f"Invalid date: {date_query}",
-                    suggestion=f"Date value error: {str(e)}"
-                )
+        # 4. Chinese weekday: 上周一, 本周三
+        if kind == "cn_weekday":
+            target_weekday = DateParser.WEEKDAY_CN[match.group("cn_weekday_name")]
+            return DateParser._get_date_by_weekday(
+                target_weekday, match.group("cn_week") == "上", now
+            )
+
+        # 5. English weekday: last monday, this friday
+        if kind == "en_weekday":
+            target_weekday = DateParser.WEEKDAY_EN[match.group("en_weekday_name")]
+            return DateParser._get_date_by_weekday(
+                target_weekday, match.group("en_week") == "last", now
+            )
 
-        # 7. Try to parse Chinese date: MM月DD日 or YYYY年MM月DD日
-        cn_date_match = re.match(r'(?:(\d{4})年)?(\d{1,2})月(\d{1,2})日', date_query)
-        if cn_date_match:
-            year_str = cn_date_match.group(1)
-            month = int(cn_date_match.group(2))
-            day = int(cn_date_match.group(3))
+        # 6-8. Absolute dates: YYYY-MM-DD, MM月DD日 / YYYY年MM月DD日, MM/DD / YYYY/MM/DD
+        if kind is not None:
+            year_str, month_str, day_str = match.group(
+                f"{kind}_year", f"{kind}_month", f"{kind}_day"
+            )
+            month = int(month_str)
+            day = int(day_str)
 
             # If no year, use current year
             if year_str:
                 year = int(year_str)
             else:
-                year = datetime.now().year
+                year = now.year
                 # If month is greater than current month, it's last year
-                current_month = datetime.now().month
-                if month > current_month:
-                    year -= 1
-
-            try:
-                return datetime(year, month, day)
-            except ValueError as e:
-                raise InvalidParameterError(
-                    f"Invalid date: {date_query}",
-                    suggestion=f"Date value error: {str(e)}"
-                )
-
-        # 8. Try to parse slash format: YYYY/MM/DD or MM/DD
-        slash_date_match = re.match(r'(?:(\d{4})/)?(\d{1,2})/(\d{1,2})', date_query)
-        if slash_date_match:
-            year_str = slash_date_match.group(1)
-            month = int(slash_date_match.group(2))
-            day = int(slash_date_match.group(3))
-
-            if year_str:
-                year = int(year_str)
-            else:
-                year = datetime.now().year
-                current_month = datetime.now().month
-                if month > current_month:
+                if month > now.month:
                     year -= 1
 
             try:
@@ -248,29 +234,31 @@ class DateParser:
         )
 
     @staticmethod
-    def _get_date_by_weekday(target_weekday: int, is_last_week: bool) -> datetime:
+    def _get_date_by_weekday(
+        target_weekday: int,
+        is_last_week: bool,
+        now: Optional[datetime] = None
+    ) -> datetime:
         """
         Get date by weekday
 
         Args:
             target_weekday: Target weekday (0=Monday, 6=Sunday)
             is_last_week: Whether it's last week
+            now: Current time, defaults to datetime.now()
 
         Returns:
             datetime object
         """
-        today = datetime.now()
-        current_weekday = today.weekday()
+        today = now if now is not None else datetime.now()
 
-        # Calculate days difference
+        days_diff = today.weekday() - target_weekday
         if is_last_week:
             # A day of last week
-            days_diff = current_weekday - target_weekday + 7
+            days_diff += 7
         else:
-            # A day of this week
-            days_diff = current_weekday - target_weekday
-            if days_diff < 0:
-                days_diff += 7
+            # A day of this week, the most recent one if it is still ahead
+            days_diff %= 7
 
         return today - timedelta(days=days_diff)
 
@@ -289,38 +277,48 @@ class DateParser:
             >>> DateParser.format_date_folder(datetime(2025, 10, 11))
             '2025年10月11日'
         """
-        return date.strftime("%Y年%m月%d日")
+        return f"{date.year}年{date.month:02d}月{date.day:02d}日"
 
     @staticmethod
-    def validate_date_not_future(date: datetime) -> None:
+    def validate_date_not_future(date: datetime, now: Optional[datetime] = None) -> None:
         """
         Validate date is not in the future
 
         Args:
             date: Date to validate
+            now: Current time, defaults to datetime.now()
 
         Raises:
             InvalidParameterError: Date is in the future
         """
-        if date.date() > datetime.now().date():
+        if now is None:
+            now = datetime.now()
+        if date.date() > now.date():
             raise InvalidParameterError(
                 f"Cannot query future date: {date.strftime('%Y-%m-%d')}",
                 suggestion="Please use today or past dates"
             )
 
     @staticmethod
-    def validate_date_not_too_old(date: datetime, max_days: int = 365) -> None:
+    def validate_date_not_too_old(
+        date: datetime,
+        max_days: int = 365,
+        now: Optional[datetime] = None
+    ) -> None:
         """
         Validate date is not too old
 
         Args:
             date: Date to validate
             max_days: Maximum days
+            now: Current time, defaults to datetime.now()
 
         Raises:
             InvalidParameterError: Date is too old
         """
-        days_ago = (datetime.now().date() - date.date()).days
+        if now is None:
+            now = datetime.now()
+        days_ago = (now.date() - date.date()).days
         if days_ago > max_days:
             raise InvalidParameterError(
                 f"Date too old: {date.strftime('%Y-%m-%d')} ({days_ago} days ago)",
@@ -328,7 +326,7 @@ class DateParser:
             )
 
     @staticmethod
-    def resolve_date_range_expression(expression: str) -> Dict:
+    def resolve_date_range_expression(expression: str, now: Optional[datetime] = None) -> Dict:
         """
         Resolve natural language date expression to standard date range
 
@@ -342,6 +340,7 @@ class DateParser:
                 - This/last month: "this month", "last month"
                 - Last N days: "last 7 days", "last 30 days"
                 - Dynamic N days: "last 5 days", "last 10 days"
+            now: Current time, defaults to datetime.now()
 
         Returns:
             Parsed result dictionary:
@@ -373,28 +372,13 @@ class DateParser:
                 suggestion="Please provide a valid date expression, e.g.: this week, last 7 days, last week"
             )
 
-        expression_lower = expression.strip().lower()
-        today = datetime.now()
-        today_str = today.strftime("%Y-%m-%d")
-
-        # 1. Try to match predefined expressions
-        normalized = DateParser.RANGE_EXPRESSIONS.get(expression_lower)
-
-        # 2. Try to match dynamic "最近N天" / "last N days" pattern
-        if not normalized:
-            # Chinese: 最近N天
-            cn_match = re.match(r'最近(\d+)天', expression_lower)
-            if cn_match:
-                days = int(cn_match.group(1))
-                normalized = f"last_{days}_days"
-
-            # English: last N days
-            en_match = re.match(r'(?:last|past)\s+(\d+)\s+days?', expression_lower)
-            if en_match:
-                days = int(en_match.group(1))
-                normalized = f"last_{days}_days"
+        if now is None:
+            now = datetime.now()
+        # Ranges only depend on the calendar day
+        today = now.date()
 
-        if not normalized:
+        resolved = DateParser._resolve_range(expression, today)
+        if resolved is None:
             # Provide list of supported expressions
             supported_cn = ["今天", "昨天", "本周", "上周", "本月", "上月",
                            "最近7天", "最近30天", "最近N天"]
@@ -405,34 +389,76 @@ class DateParser:
                 suggestion=f"Supported expressions:\nChinese: {', '.join(supported_cn)}\nEnglish: {', '.join(supported_en)}"
             )
 
-        # 3. Calculate date range based on normalized type
-        start_date, end_date, description = DateParser._calculate_date_range(
-            normalized, today
-        )
-
+        normalized, start_str, end_str, description = resolved
         return {
             "success": True,
             "expression": expression,
             "normalized": normalized,
             "date_range": {
-                "start": start_date.strftime("%Y-%m-%d"),
-                "end": end_date.strftime("%Y-%m-%d")
+                "start": start_str,
+                "end": end_str
             },
-            "current_date": today_str,
+            "current_date": today.strftime("%Y-%m-%d"),
             "description": description
         }
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _resolve_range(
+        expression: str,
+        today: date
+    ) -> Optional[Tuple[str, str, str, str]]:
+        """
+        Resolve an expression for a day (cached per expression and day)
+
+        Args:
+            expression: Date expression as given, normalized here on a cache miss
+            today: Current date
+
+        Returns:
+            (normalized, start, end, description) tuple, None if unrecognized
+        """
+        expression_lower = expression.strip().lower()
+
+        # 1. Try to match predefined expressions
+        normalized = DateParser.RANGE_EXPRESSIONS.get(expression_lower)
+        days = None
+
+        # 2. Try to match dynamic "最近N天" / "last N days" pattern
+        if not normalized:
+            # Chinese 最近N天 or English last N days, in one match
+            match = DateParser.LAST_N_DAYS_PATTERN.match(expression_lower)
+            if match:
+                days = int(match.group("cn_days") or match.group("en_days"))
+                normalized = f"last_{days}_days"
+
+        if not normalized:
+            return None
+
+        # 3. Calculate date range based on normalized type
+        start_date, end_date, description = DateParser._calculate_date_range(
+            normalized, today, days
+        )
+        return (
+            normalized,
+            start_date.strftime("%Y-%m-%d"),
+            end_date.strftime("%Y-%m-%d"),
+            description
+        )
+
     @staticmethod
     def _calculate_date_range(
         normalized: str,
-        today: datetime
-    ) -> Tuple[datetime, datetime, str]:
+        today: date,
+        days: Optional[int] = None
+    ) -> Tuple[date, date, str]:
         """
         Calculate actual date range based on normalized date type
 
         Args:
             normalized: Normalized date type
             today: Current date
+            days: N of a last_N_days type when already known, saves parsing it back
 
         Returns:
             (start_date, end_date, description) tuple
@@ -450,41 +476,41 @@ class DateParser:
             # Calculate this Monday
             weekday = today.weekday()  # 0=Monday, 6=Sunday
             start = today - timedelta(days=weekday)
-            end = start + timedelta(days=6)
-            # If this week hasn't ended, end cannot exceed today
-            if end > today:
-                end = today
-            return start, end, f"This week (Monday to Sunday, {start.strftime('%m-%d')} to {end.strftime('%m-%d')})"
+            # This week's Sunday is never before today, so the range ends today
+            end = today
+            return start, end, f"This week (Monday to Sunday, {start.month:02d}-{start.day:02d} to {end.month:02d}-{end.day:02d})"
 
         # Last week (last Monday to last Sunday)
         if normalized == "last_week":
             weekday = today.weekday()
-            # This Monday
-            this_monday = today - timedelta(days=weekday)
-            # Last Monday
-            start = this_monday - timedelta(days=7)
+            # Last Monday, a week before this Monday
+            start = today - timedelta(days=weekday + 7)
             end = start + timedelta(days=6)
-            return start, end, f"Last week ({start.strftime('%m-%d')} to {end.strftime('%m-%d')})"
+            return start, end, f"Last week ({start.month:02d}-{start.day:02d} to {end.month:02d}-{end.day:02d})"
 
         # This month (1st of this month to today)
         if normalized == "this_month":
             start = today.replace(day=1)
-            return start, today, f"This month ({start.strftime('%m-%d')} to {today.strftime('%m-%d')})"
+            return start, today, f"This month ({start.month:02d}-{start.day:02d} to {today.month:02d}-{today.day:02d})"
 
         # Last month (1st of last month to last day of last month)
         if normalized == "last_month":
-            # Last day of last month = 1st of this month - 1 day
-            first_of_this_month = today.replace(day=1)
-            end = first_of_this_month - timedelta(days=1)
-            start = end.replace(day=1)
+            if today.month > 1:
+                year, month = today.year, today.month - 1
+            else:
+                year, month = today.year - 1, 12
+            start = today.replace(year=year, month=month, day=1)
+            end = start.replace(day=calendar.monthrange(year, month)[1])
             return start, end, f"Last month ({start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')})"
 
         # Last N days (last_N_days format)
-        match = re.match(r'last_(\d+)_days', normalized)
-        if match:
-            days = int(match.group(1))
+        if days is None:
+            match = DateParser.LAST_N_DAYS_NORMALIZED_PATTERN.match(normalized)
+            if match:
+                days = int(match.group(1))
+        if days is not None:
             start = today - timedelta(days=days - 1)  # Include today, so days-1
-            return start, today, f"Last {days} days ({start.strftime('%m-%d')} to {today.strftime('%m-%d')})"
+            return start, today, f"Last {days} days ({start.month:02d}-{start.day:02d} to {today.month:02d}-{today.day:02d})"
 
         # Fallback: return today
         return today, today, "Today (default)"
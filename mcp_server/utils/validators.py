@@ -5,14 +5,67 @@ Provides unified parameter validation functionality.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import FrozenSet, List, Optional, Sequence, Tuple
+import logging
 import os
 import yaml
 
+# libyaml's C loader when PyYAML was built with it, same results as SafeLoader
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 from .errors import InvalidParameterError
 from .date_parser import DateParser
 
 
+logger = logging.getLogger(__name__)
+
+# Config sections accepted by validate_config_section
+_CONFIG_SECTIONS = ("all", "crawler", "push", "keywords", "weights")
+
+# DataService behind the available range hint, kept so its output scan is reused
+_range_service = None
+
+# config.yaml path (relative to current file)
+_CONFIG_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "config", "config.yaml")
+)
+
+# Platforms from the last config.yaml read: (mtime_ns, platform ID list, platform ID set)
+_platforms_cache: Optional[Tuple[int, List[str], FrozenSet[str]]] = None
+
+
+def _load_platforms() -> Tuple[List[str], FrozenSet[str]]:
+    """
+    Load platform IDs from config.yaml as a list and as a set for membership checks
+
+    Returns:
+        (platform ID list, platform ID set) tuple, both empty on read failure
+    """
+    global _platforms_cache
+
+    try:
+        # Reuse the last read until the file is modified
+        mtime_ns = os.stat(_CONFIG_PATH).st_mtime_ns
+        if _platforms_cache is not None and _platforms_cache[0] == mtime_ns:
+            return _platforms_cache[1], _platforms_cache[2]
+
+        with open(_CONFIG_PATH, 'r', encoding='utf-8') as f:
+            config = yaml.load(f, Loader=YamlLoader)
+            platforms = config.get('platforms', [])
+            platform_ids = [p['id'] for p in platforms if 'id' in p]
+
+        platform_set = frozenset(platform_ids)
+        _platforms_cache = (mtime_ns, platform_ids, platform_set)
+        return platform_ids, platform_set
+    except Exception as e:
+        # Fallback: return empty list, allow all platforms
+        logger.warning("Unable to load platform configuration (%s): %s", _CONFIG_PATH, e)
+        return [], frozenset()
+
+
 def get_supported_platforms() -> List[str]:
     """
     Dynamically get supported platform list from config.yaml
@@ -23,21 +76,9 @@ def get_supported_platforms() -> List[str]:
     Note:
         - Returns empty list on read failure, allowing all platforms (fallback strategy)
         - Platform list comes from platforms configuration in config/config.yaml
+        - The list is reused until config.yaml is modified, callers must not change it
     """
-    try:
-        # Get config.yaml path (relative to current file)
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        config_path = os.path.join(current_dir, "..", "..", "config", "config.yaml")
-        config_path = os.path.normpath(config_path)
-
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-            platforms = config.get('platforms', [])
-            return [p['id'] for p in platforms if 'id' in p]
-    except Exception as e:
-        # Fallback: return empty list, allow all platforms
-        print(f"Warning: Unable to load platform configuration ({config_path}): {e}")
-        return []
+    return _load_platforms()[0]
 
 
 def validate_platforms(platforms: Optional[List[str]]) -> List[str]:
@@ -58,27 +99,25 @@ def validate_platforms(platforms: Optional[List[str]]) -> List[str]:
         - Validates whether platform ID exists in config.yaml platforms configuration
         - When config loading fails, allows all platforms (fallback strategy)
     """
-    supported_platforms = get_supported_platforms()
-
-    if platforms is None:
-        # Return platform list from config file (user's default configuration)
-        return supported_platforms if supported_platforms else []
-
-    if not isinstance(platforms, list):
+    # Reject a wrong type before touching the config
+    if platforms is not None and not isinstance(platforms, list):
         raise InvalidParameterError("platforms parameter must be a list type")
 
+    supported_platforms, supported_set = _load_platforms()
+
     if not platforms:
-        # When empty list, return platform list from config file
+        # None or empty list, return platform list from config file (user's default configuration)
         return supported_platforms if supported_platforms else []
 
     # If config loading failed (supported_platforms is empty), allow all platforms
     if not supported_platforms:
-        print("Warning: Platform configuration not loaded, skipping platform validation")
+        logger.warning("Platform configuration not loaded, skipping platform validation")
         return platforms
 
-    # Validate each platform exists in configuration
-    invalid_platforms = [p for p in platforms if p not in supported_platforms]
-    if invalid_platforms:
+    # Validate each platform exists in configuration, in one set check,
+    # then list the unknown ones in request order for the error
+    if not supported_set.issuperset(platforms):
+        invalid_platforms = [p for p in platforms if p not in supported_set]
         raise InvalidParameterError(
             f"Unsupported platforms: {', '.join(invalid_platforms)}",
             suggestion=f"Supported platforms (from config.yaml): {', '.join(supported_platforms)}"
@@ -100,12 +139,12 @@ def validate_limit(limit: Optional[int], default: int = 20, max_limit: int = 100
         Validated limit value
 
     Raises:
-        InvalidParameterError: Parameter invalid
+        InvalidParameterError: Parameter invalid, including True/False passed as a limit
     """
     if limit is None:
         return default
 
-    if not isinstance(limit, int):
+    if type(limit) is not int:
         raise InvalidParameterError("limit parameter must be an integer type")
 
     if limit <= 0:
@@ -134,6 +173,11 @@ def validate_date(date_str: str) -> datetime:
         InvalidParameterError: Invalid date format
     """
     try:
+        # Zero-padded YYYY-MM-DD is read directly, strptime handles the other forms it accepts
+        if (len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-"
+                and date_str.isascii() and date_str[:4].isdigit()
+                and date_str[5:7].isdigit() and date_str[8:].isdigit()):
+            return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
         return datetime.strptime(date_str, "%Y-%m-%d")
     except ValueError:
         raise InvalidParameterError(
@@ -142,12 +186,16 @@ def validate_date(date_str: str) -> datetime:
         )
 
 
-def validate_date_range(date_range: Optional[dict]) -> Optional[tuple]:
+def validate_date_range(
+    date_range: Optional[dict],
+    now: Optional[datetime] = None
+) -> Optional[tuple]:
     """
     Validate date range
 
     Args:
         date_range: Date range dictionary {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}
+        now: Current time, defaults to datetime.now()
 
     Returns:
         (start_date, end_date) tuple, or None
@@ -180,35 +228,48 @@ def validate_date_range(date_range: Optional[dict]) -> Optional[tuple]:
         )
 
     # Check if date is in the future
-    today = datetime.now().date()
-    if start_date.date() > today or end_date.date() > today:
+    # start is not after end, so the range reaches the future exactly when end does
+    today = (now if now is not None else datetime.now()).date()
+    if end_date.date() > today:
         # Get available date range hint
-        try:
-            from ..services.data_service import DataService
-            data_service = DataService()
-            earliest, latest = data_service.get_available_date_range()
-
-            if earliest and latest:
-                available_range = f"{earliest.strftime('%Y-%m-%d')} to {latest.strftime('%Y-%m-%d')}"
-            else:
-                available_range = "No available data"
-        except Exception:
-            available_range = "Unknown (please check output directory)"
+        available_range = _get_available_range_hint()
 
         future_dates = []
         if start_date.date() > today:
             future_dates.append(start_str)
-        if end_date.date() > today and end_str != start_str:
+        if end_str != start_str:
             future_dates.append(end_str)
 
         raise InvalidParameterError(
-            f"Future dates not allowed: {', '.join(future_dates)} (current date: {today.strftime('%Y-%m-%d')})",
+            f"Future dates not allowed: {', '.join(future_dates)} (current date: {today.isoformat()})",
             suggestion=f"Available data range: {available_range}"
         )
 
     return (start_date, end_date)
 
 
+def _get_available_range_hint() -> str:
+    """
+    Describe the date range that has data, for future date errors
+
+    Returns:
+        Available date range text
+    """
+    global _range_service
+
+    try:
+        if _range_service is None:
+            from ..services.data_service import DataService
+            _range_service = DataService()
+        earliest, latest = _range_service.get_available_date_range()
+
+        if earliest and latest:
+            return f"{earliest.strftime('%Y-%m-%d')} to {latest.strftime('%Y-%m-%d')}"
+        return "No available data"
+    except Exception:
+        return "Unknown (please check output directory)"
+
+
 def validate_keyword(keyword: str) -> str:
     """
     Validate keyword
@@ -225,7 +286,7 @@ def validate_keyword(keyword: str) -> str:
     if not keyword:
         raise InvalidParameterError("keyword cannot be empty")
 
-    if not isinstance(keyword, str):
+    if type(keyword) is not str:
         raise InvalidParameterError("keyword must be a string type")
 
     keyword = keyword.strip()
@@ -259,13 +320,13 @@ def validate_top_n(top_n: Optional[int], default: int = 10) -> int:
     return validate_limit(top_n, default=default, max_limit=100)
 
 
-def validate_mode(mode: Optional[str], valid_modes: List[str], default: str) -> str:
+def validate_mode(mode: Optional[str], valid_modes: Sequence[str], default: str) -> str:
     """
     Validate mode parameter
 
     Args:
         mode: Mode string
-        valid_modes: Valid mode list
+        valid_modes: Valid mode list or tuple
         default: Default mode
 
     Returns:
@@ -277,7 +338,7 @@ def validate_mode(mode: Optional[str], valid_modes: List[str], default: str) ->
     if mode is None:
         return default
 
-    if not isinstance(mode, str):
+    if type(mode) is not str:
         raise InvalidParameterError("mode must be a string type")
 
     if mode not in valid_modes:
@@ -302,14 +363,14 @@ def validate_config_section(section: Optional[str]) -> str:
     Raises:
         InvalidParameterError: Invalid config section
     """
-    valid_sections = ["all", "crawler", "push", "keywords", "weights"]
-    return validate_mode(section, valid_sections, "all")
+    return validate_mode(section, _CONFIG_SECTIONS, "all")
 
 
 def validate_date_query(
     date_query: str,
     allow_future: bool = False,
-    max_days_ago: int = 365
+    max_days_ago: int = 365,
+    now: Optional[datetime] = None
 ) -> datetime:
     """
     Validate and parse date query string
@@ -318,6 +379,7 @@ def validate_date_query(
         date_query: Date query string
         allow_future: Whether to allow future dates
         max_days_ago: Maximum days allowed for query
+        now: Current time, defaults to datetime.now()
 
     Returns:
         Parsed datetime object
@@ -337,14 +399,16 @@ def validate_date_query(
             suggestion="Please provide a date query, e.g.: today, yesterday, 2025-10-10"
         )
 
-    # Use DateParser to parse date
-    parsed_date = DateParser.parse_date_query(date_query)
+    # Use DateParser to parse date, all checks share one clock reading
+    if now is None:
+        now = datetime.now()
+    parsed_date = DateParser.parse_date_query(date_query, now)
 
     # Validate date is not in the future
     if not allow_future:
-        DateParser.validate_date_not_future(parsed_date)
+        DateParser.validate_date_not_future(parsed_date, now)
 
     # Validate date is not too old
-    DateParser.validate_date_not_too_old(parsed_date, max_days=max_days_ago)
+    DateParser.validate_date_not_too_old(parsed_date, max_days=max_days_ago, now=now)
 
     return parsed_date